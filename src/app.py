@@ -1,47 +1,72 @@
 import streamlit as st
-from data.mongo import load_students
+from data.mongo import load_roster, reload_students
+from data.sources import get_source
+from data.cache import dataset_age, dataset_error
+from data.schema import memory_footprint
+from logic.teachers_metric import load_teacher_data
+from logic.student_index import get_student_index
+from logic.search_index import get_search_index
 from views.teachers_page import render_teachers_page
 from views.students_page import render_students_dashboard
-from config.settings import TOTAL_LESSONS
-
-# Load MongoDB data
-df = load_students()
+from views.risk_page import render_risk_page
+from ui.debug_panel import debug_panel_enabled, render_debug_panel
+from telemetry.spans import span, start_run
+from telemetry.export import start_exporter
+from config.settings import (
+    TOTAL_LESSONS,
+    TELEMETRY_EXPORT,
+    TELEMETRY_EXPORT_PATH,
+    TELEMETRY_EXPORT_INTERVAL_SECONDS,
+)
+
+# Must be the first Streamlit command of every run
+st.set_page_config(
+    page_title="Student Stats Dashboard",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+start_run()
+start_exporter(TELEMETRY_EXPORT, TELEMETRY_EXPORT_PATH, TELEMETRY_EXPORT_INTERVAL_SECONDS)
+
+# Load the lightweight roster (full student documents are fetched per student)
+with span("data.load_roster"):
+    df = load_roster()
 
 
 # Sidebar with navigation
 with st.sidebar:
     st.markdown("### 🎯 Navigation")
-    page = st.radio("Select Page:", ["Student Dashboard", "Teachers Overview"])
+    page = st.radio("Select Page:", ["Student Dashboard", "Teachers Overview", "Needs Attention"])
 
     st.markdown("---")
 
-    selected_name = None
+    selected_id = None
     # STUDENT SELECTION + SEARCH
     if page == "Student Dashboard":
         st.markdown("### 🔍 Search Student")
 
         search_query = st.text_input(
-            "Search by name:",
-            placeholder="Type to search...",
+            "Search by name or phone:",
+            placeholder="Type a name or phone...",
             label_visibility="collapsed"
         )
 
         if not df.empty:
-            student_list = df["name"].tolist()
+            index = get_student_index(df)
 
-            # Case-insensitive filtering
+            # Ranked search: prefix / substring / phone, then typo-tolerant matches
             if search_query:
-                filtered_students = [
-                    s for s in student_list
-                    if search_query.lower() in s.lower()
-                ]
+                with span("logic.search"):
+                    filtered_ids = get_search_index(df).search(search_query)
             else:
-                filtered_students = student_list
+                filtered_ids = index.ids
 
-            if filtered_students:
-                selected_name = st.selectbox(
+            if filtered_ids:
+                selected_id = st.selectbox(
                     "Choose a student:",
-                    filtered_students,
+                    filtered_ids,
+                    format_func=index.label,
                     label_visibility="collapsed"
                 )
             else:
@@ -53,23 +78,49 @@ with st.sidebar:
     st.markdown(f"**Total Lessons:** {TOTAL_LESSONS}")
 
     if not df.empty and "current_lesson" in df.columns:
-        avg_completion = df["current_lesson"].astype(int).mean()
+        avg_completion = df["current_lesson"].mean()
         st.markdown(f"**Avg Completion:** {avg_completion:.1f}/{TOTAL_LESSONS}")
 
+    st.caption(f"Roster in memory: {memory_footprint(df) / 1024 / 1024:.1f} MB")
+
+    date_failures = sum(df.attrs.get("date_parse_failures", {}).values())
+    if date_failures:
+        st.caption(f"⚠️ {date_failures} date values could not be parsed")
+
     st.markdown("---")
     st.markdown("### 🔄 Refresh Data")
+    age = dataset_age()
+    if age is not None:
+        st.caption(f"Data loaded {age:.0f}s ago")
+    error = dataset_error()
+    if error is not None:
+        st.caption(f"⚠️ Refresh failed ({type(error).__name__}); showing the last loaded data")
     if st.button("🔄 Reload", use_container_width=True):
-        st.cache_data.clear()
+        reload_students()
         st.rerun()
 
+    with st.expander("🩺 Database Health"):
+        if st.button("Check connection", use_container_width=True):
+            st.json(get_source().info())
+
 
 
 # Page Routing
 if page == "Teachers Overview":
-    render_teachers_page(df)
+    with span("data.load_teacher_data"):
+        teacher_data = load_teacher_data()
+    render_teachers_page(teacher_data)
+
+elif page == "Needs Attention":
+    render_risk_page()
 
 elif page == "Student Dashboard":
-    if selected_name:
-        render_students_dashboard(df, selected_name, TOTAL_LESSONS)
+    if selected_id:
+        render_students_dashboard(df, selected_id, TOTAL_LESSONS)
     else:
         st.info("Please select a student from the sidebar.")
+
+# Timings of this rerun (opt-in); rendered last so every section is included
+if debug_panel_enabled():
+    with st.sidebar:
+        render_debug_panel()
@@ -0,0 +1,41 @@
+"""
+Compare two benchmark result files written by benchmarks.run.
+
+    python -m benchmarks.compare baseline.json current.json --threshold 1.2
+Exits with status 1 if any benchmark got slower than `threshold` x baseline.
+"""
+import argparse
+import json
+import sys
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return report["meta"], {(r["name"], r["students"]): r["seconds"] for r in report["results"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio that counts as a regression")
+    args = parser.parse_args(argv)
+
+    base_meta, baseline = _load(args.baseline)
+    cur_meta, current = _load(args.current)
+    print(f"baseline {base_meta.get('commit')}  vs  current {cur_meta.get('commit')}")
+
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys()):
+        ratio = current[key] / baseline[key] if baseline[key] else float("inf")
+        flag = "  REGRESSION" if ratio > args.threshold else ""
+        regressions += bool(flag)
+        name, students = key
+        print(f"{name:<34} {students:>8}  {baseline[key] * 1000:>10.1f} ms -> {current[key] * 1000:>10.1f} ms  x{ratio:.2f}{flag}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Import-time report for the dashboard's cold start.
+
+Imports every module app.py imports (without running the app) under
+`python -X importtime` and summarizes the cost per top-level package.
+
+Run from src/:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --top 15 --json importtime.json
+    python -m benchmarks.importtime --forbid matplotlib altair   # exit 1 if imported at startup
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+
+from collections import defaultdict
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def app_imports(path=APP):
+    """Top-level modules imported by app.py, in order."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def measure(modules):
+    """Run the imports in a fresh interpreter; returns [(module, self_us, cumulative_us, depth)]."""
+    env = {
+        **os.environ,
+        "TOTAL_LESSONS": os.environ.get("TOTAL_LESSONS", "18"),
+        "MONGO_HOST": os.environ.get("MONGO_HOST", "localhost"),
+        "MONGO_PORT": os.environ.get("MONGO_PORT", "27017"),
+    }
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(APP), env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr[-2000:])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def summarize(rows):
+    """Total import time and self time per top-level package (microseconds)."""
+    per_package = defaultdict(int)
+    for module, self_us, _, _ in rows:
+        per_package[module.split(".")[0]] += self_us
+    total = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    return total, dict(sorted(per_package.items(), key=lambda item: -item[1]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize the import cost of the dashboard's startup imports.")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", help="also write the summary to this file")
+    parser.add_argument("--forbid", nargs="*", default=[], help="packages that must not be imported at startup")
+    args = parser.parse_args(argv)
+
+    modules = app_imports()
+    rows = measure(modules)
+    total, per_package = summarize(rows)
+
+    print(f"Startup imports: {', '.join(modules)}")
+    print(f"Total: {total / 1000:.0f} ms across {len(rows)} modules\n")
+    for package, self_us in list(per_package.items())[:args.top]:
+        print(f"{package:<28} {self_us / 1000:>8.1f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"total_us": total, "modules": len(rows), "packages_us": per_package}, f, indent=2)
+
+    imported = [package for package in args.forbid if package in per_package]
+    if imported:
+        print(f"\nImported at startup but forbidden: {', '.join(imported)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
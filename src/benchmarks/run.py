@@ -0,0 +1,136 @@
+"""
+Offline benchmark suite for the dashboard hot paths.
+
+Run from src/:
+    python -m benchmarks.run --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.compare old.json new.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from datetime import datetime, timezone
+
+# Settings are read at import time; the suite never talks to Mongo
+os.environ.setdefault("TOTAL_LESSONS", "18")
+os.environ.setdefault("MONGO_HOST", "localhost")
+os.environ.setdefault("MONGO_PORT", "27017")
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import generate_students
+from data.snapshot import SnapshotSource, write_snapshot
+from data.streaming import stream_student_tables
+from data.tables import build_student_tables, build_students_frame
+from logic.exports import leaderboard_table
+from logic.metrics import calculate_cohort_metrics, calculate_student_metrics
+from logic.risk import calculate_risk
+from logic.teachers_metric import categorize_students_by_teacher, categorize_students_by_teacher_columnar
+from ui.charts import render_practice_heatmap, render_progress_ring, render_trend_chart
+from ui.chart_cache import figure_to_png
+
+
+def _time(fn, repeat):
+    """Best-of-`repeat` wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _per_student_metrics(df):
+    for _, student in df.iterrows():
+        calculate_student_metrics(student)
+
+
+def benchmarks_for(docs, seed, snapshot_dir):
+    """(name, callable) pairs for one dataset size."""
+    write_snapshot(docs, snapshot_dir)
+    wide = build_students_frame(docs)
+    students, lessons = build_student_tables(docs)
+    teacher_data = categorize_students_by_teacher_columnar(students, lessons)
+
+    # Charts render one student; use a clean, full-length one so sizes are comparable
+    chart_lessons = generate_students(1, lessons_per_student=(18, 18), malformed_rate=0, seed=seed)[0]["lessons"]
+
+    return [
+        ("decode.students_frame", lambda: build_students_frame(docs)),
+        ("decode.student_tables", lambda: build_student_tables(docs)),
+        ("decode.student_tables_streaming", lambda: stream_student_tables(docs)),
+        ("decode.snapshot_read", lambda: SnapshotSource(snapshot_dir).student_tables()),
+        ("metrics.per_student", lambda: _per_student_metrics(wide)),
+        ("metrics.cohort", lambda: calculate_cohort_metrics(students, lessons)),
+        ("risk.calculate", lambda: calculate_risk(students, lessons, pd.Timestamp("2025-01-01"))),
+        ("teachers.categorize_iterrows", lambda: categorize_students_by_teacher(wide)),
+        ("teachers.categorize_columnar", lambda: categorize_students_by_teacher_columnar(students, lessons)),
+        ("teachers.leaderboard_table", lambda: leaderboard_table(teacher_data)),
+        ("charts.progress_ring", lambda: figure_to_png(render_progress_ring(12, 18))),
+        ("charts.practice_heatmap", lambda: figure_to_png(render_practice_heatmap(chart_lessons))),
+        ("charts.trend", lambda: figure_to_png(render_trend_chart(chart_lessons))),
+    ]
+
+
+def run(sizes, repeat, seed, only=None):
+    results = []
+    for size in sizes:
+        docs = generate_students(students=size, seed=seed)
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            for name, fn in benchmarks_for(docs, seed, snapshot_dir):
+                if only and not any(part in name for part in only):
+                    continue
+                seconds = _time(fn, repeat)
+                results.append({"name": name, "students": size, "seconds": seconds, "repeat": repeat})
+                print(f"{name:<34} {size:>8} students  {seconds * 1000:>10.1f} ms", flush=True)
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard hot paths on synthetic data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="*", help="run only benchmarks whose name contains one of these")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.seed, args.only)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import random
+
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+FIRST_NAMES = [
+    "נועה", "תמר", "מאיה", "יעל", "שירה", "אביגיל", "רוני", "דניאל", "איתי", "יונתן",
+    "אורי", "עומר", "נועם", "אריאל", "משה", "דוד", "שרה", "רבקה", "Dana", "Ron",
+]
+LAST_NAMES = [
+    "כהן", "לוי", "מזרחי", "פרץ", "ביטון", "דהן", "אברהם", "פרידמן", "אזולאי", "שפירא",
+    "Levi", "Cohen", "Katz", "Mizrahi",
+]
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Shapes seen in real `practice_count` values that do not parse as int
+MALFORMED_COUNTS = ["", "x", None, "3.5", "n/a"]
+
+
+def _date_string(moment):
+    return f"{DAYS[moment.weekday()]}, {moment:%d.%m.%Y}"
+
+
+def generate_students(students=1000, lessons_per_student=(1, 18), teachers=20,
+                      malformed_rate=0.02, seed=0, start=datetime(2024, 1, 1)):
+    """
+    Seeded `student_stats`-shaped documents: Hebrew (and some Latin) names,
+    phone numbers, "day, dd.mm.yyyy" date strings, lessons with teacher
+    changes, and a `malformed_rate` share of unparsable practice counts.
+    """
+    rng = random.Random(seed)
+    teacher_names = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}" for i in range(teachers)]
+
+    docs = []
+    for _ in range(students):
+        n_lessons = rng.randint(*lessons_per_student)
+        teacher = rng.choice(teacher_names)
+        day = start + timedelta(days=rng.randint(0, 300))
+
+        lessons = []
+        for lesson_num in range(1, n_lessons + 1):
+            if rng.random() < 0.1:
+                teacher = rng.choice(teacher_names)
+
+            count = rng.randint(1, 8)
+            if rng.random() < malformed_rate:
+                count = rng.choice(MALFORMED_COUNTS)
+            elif rng.random() < 0.3:
+                count = str(count)
+
+            lessons.append({
+                "lesson": lesson_num,
+                "teacher": teacher,
+                "practice_count": count,
+                "first_practice": _date_string(day),
+            })
+            day += timedelta(days=rng.randint(1, 10))
+
+        docs.append({
+            "_id": ObjectId(rng.randbytes(12)),
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "phone_number": f"05{rng.randint(0, 9)}-{rng.randint(1000000, 9999999)}",
+            "current_lesson": n_lessons,
+            "total_messages": rng.randint(n_lessons, n_lessons * 10),
+            "last_message_timedate": _date_string(day),
+            "last_practice_timedate": _date_string(day),
+            "updated_at": day,
+            "lessons": lessons,
+        })
+
+    return docs
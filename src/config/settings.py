@@ -1,6 +1,5 @@
 import os
 from dotenv import load_dotenv
-import streamlit as st
 
 # Load environment variables
 load_dotenv()
@@ -11,8 +10,59 @@ MONGO_PORT = os.getenv("MONGO_PORT")
 MONGO_HOST = os.getenv("MONGO_HOST")
 TOTAL_LESSONS = int(os.getenv("TOTAL_LESSONS"))
 
-st.set_page_config(
-    page_title="Student Stats Dashboard",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
\ No newline at end of file
+# Connection pool and timeouts (one client per process)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "20"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "30000"))
+# "primary" by default: secondaries can lag, which would also hold back the incremental sync watermark
+MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+
+# Documents per cursor batch; loads decode one batch at a time into Arrow record batches
+MONGO_BATCH_SIZE = int(os.getenv("MONGO_BATCH_SIZE", "2000"))
+
+# Data source: "mongo" reads the live collection, "snapshot" a memory-mapped Arrow snapshot
+# (written by `python -m data.snapshot dump`), so the dashboard can run without MongoDB
+DATA_SOURCE = os.getenv("DATA_SOURCE", "mongo")
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "snapshot")
+
+# Data sync: "full" reloads the collection every 60s, "incremental" applies deltas
+SYNC_MODE = os.getenv("SYNC_MODE", "full")
+SYNC_WATERMARK_FIELD = os.getenv("SYNC_WATERMARK_FIELD", "updated_at")
+SYNC_INTERVAL_SECONDS = int(os.getenv("SYNC_INTERVAL_SECONDS", "10"))
+
+# Teacher statistics: "python" computes them in pandas, "server" runs a Mongo aggregation
+TEACHER_STATS_MODE = os.getenv("TEACHER_STATS_MODE", "python")
+
+# Chart backend: "matplotlib" renders PNGs on the server, "vega" sends Vega-Lite specs to the browser
+CHART_BACKEND = os.getenv("CHART_BACKEND", "matplotlib")
+
+# Rendered chart cache (PNG bytes), in megabytes
+CHART_CACHE_MAX_MB = int(os.getenv("CHART_CACHE_MAX_MB", "64"))
+
+# Cache shared by the replicas of one node: "off" or "disk" (a directory at SHARED_CACHE_PATH),
+# holding loaded tables, derived aggregates and chart images, capped at SHARED_CACHE_MAX_MB.
+# Entries are unpickled, so the directory must be private to the user running the replicas
+SHARED_CACHE = os.getenv("SHARED_CACHE", "off")
+SHARED_CACHE_PATH = os.getenv(
+    "SHARED_CACHE_PATH",
+    os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "student-dashboard"),
+)
+SHARED_CACHE_MAX_MB = int(os.getenv("SHARED_CACHE_MAX_MB", "1024"))
+# Timing instrumentation: opt-in sidebar panel (also via ?debug=1) and histogram export
+DEBUG_PANEL = os.getenv("DEBUG_PANEL", "0").lower() in ("1", "true", "yes")
+TELEMETRY_EXPORT = os.getenv("TELEMETRY_EXPORT", "off")  # "off", "json" or "prometheus"
+TELEMETRY_EXPORT_PATH = os.getenv("TELEMETRY_EXPORT_PATH", "dashboard_spans.prom")
+TELEMETRY_EXPORT_INTERVAL_SECONDS = int(os.getenv("TELEMETRY_EXPORT_INTERVAL_SECONDS", "60"))
+
+# Warm-up (serve.py): charts pre-rendered for this many recently active students,
+# and the side port serving /ready (200 once warmed) and /live
+WARMUP_STUDENTS = int(os.getenv("WARMUP_STUDENTS", "20"))
+READINESS_PORT = int(os.getenv("READINESS_PORT", "8502"))
+
+# "Needs Attention" risk signals: days without practice, days on the same lesson,
+# lessons in the practice trend window and the consistency score (%) counted as low
+RISK_INACTIVE_DAYS = int(os.getenv("RISK_INACTIVE_DAYS", "14"))
+RISK_STALL_DAYS = int(os.getenv("RISK_STALL_DAYS", "21"))
+RISK_TREND_LESSONS = int(os.getenv("RISK_TREND_LESSONS", "4"))
+RISK_MIN_CONSISTENCY = float(os.getenv("RISK_MIN_CONSISTENCY", "50"))
@@ -0,0 +1,100 @@
+from data.tables import fingerprint
+
+
+def _to_int(expr):
+    """Server-side equivalent of the int() coercion used in Python: bad values count as 0."""
+    return {"$convert": {"input": expr, "to": "int", "onError": 0, "onNull": 0}}
+
+
+def _or_default(expr, default):
+    return {"$ifNull": [expr, default]}
+
+
+def _students_where(condition):
+    return {"$map": {
+        "input": {"$filter": {"input": "$students", "as": "s", "cond": condition}},
+        "as": "s",
+        "in": "$$s.info",
+    }}
+
+
+# Teacher summary computed by MongoDB: same shape as categorize_students_by_teacher
+TEACHER_SUMMARY_PIPELINE = [
+    {"$match": {"lessons.0": {"$exists": True}}},
+    {"$project": {
+        "student": {
+            "name": _or_default("$name", "Unknown"),
+            "current_lesson": _or_default("$current_lesson", "N/A"),
+            "phone": _or_default("$phone_number", "N/A"),
+            "last_practice": _or_default("$last_practice_timedate", "N/A"),
+        },
+        "lessons": {"$map": {
+            "input": "$lessons",
+            "as": "l",
+            "in": {
+                "lesson": _to_int("$$l.lesson"),
+                "teacher": "$$l.teacher",
+                "practice_count": _to_int("$$l.practice_count"),
+            },
+        }},
+    }},
+    # Active teacher = teacher of the first lesson with the highest lesson number
+    {"$addFields": {"active": {"$reduce": {
+        "input": "$lessons",
+        "initialValue": {"$arrayElemAt": ["$lessons", 0]},
+        "in": {"$cond": [{"$gt": ["$$this.lesson", "$$value.lesson"]}, "$$this", "$$value"]},
+    }}}},
+    {"$unwind": "$lessons"},
+    {"$match": {"lessons.teacher": {"$nin": [None, ""]}}},
+    # One row per (student, teacher)
+    {"$group": {
+        "_id": {"student": "$_id", "teacher": "$lessons.teacher"},
+        "student": {"$first": "$student"},
+        "is_current": {"$first": {"$eq": ["$lessons.teacher", "$active.teacher"]}},
+        "practices": {"$sum": "$lessons.practice_count"},
+    }},
+    # $push keeps the order rows arrive in, which $group does not define: sort so every
+    # student list is ordered by student _id (the Python version follows roster order)
+    {"$sort": {"_id.student": 1}},
+    # One row per teacher, students split into current / past
+    {"$group": {
+        "_id": "$_id.teacher",
+        "students": {"$push": {"info": "$student", "is_current": "$is_current"}},
+        "total_practices": {"$sum": "$practices"},
+    }},
+    {"$project": {
+        "total_practices": 1,
+        "current": _students_where({"$eq": ["$$s.is_current", True]}),
+        "past": _students_where({"$ne": ["$$s.is_current", True]}),
+    }},
+    {"$sort": {"_id": 1}},
+]
+
+
+class TeacherSummary(dict):
+    """
+    teacher -> {"current": [...], "past": [...], "total_practices": int},
+    stamped with the version of the data it was computed from.
+    """
+
+    def __init__(self, data=(), version=None):
+        super().__init__(data)
+        self.version = version
+
+
+def aggregate_teacher_summary(collection):
+    """
+    Run the teacher summary on the server and return
+    teacher -> {"current": [...], "past": [...], "total_practices": int}.
+    Only the per-teacher result crosses the wire, never the student documents.
+    """
+    rows = list(collection.aggregate(TEACHER_SUMMARY_PIPELINE, allowDiskUse=True))
+    summary = {
+        row["_id"]: {
+            "current": row["current"],
+            "past": row["past"],
+            "total_practices": row["total_practices"],
+        }
+        for row in rows
+    }
+    return TeacherSummary(summary, version=fingerprint(rows))
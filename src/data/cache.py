@@ -0,0 +1,155 @@
+import functools
+import logging
+import threading
+import time
+
+from telemetry.spans import span
+
+logger = logging.getLogger(__name__)
+
+# Every dataset cache in this process, so Reload can invalidate exactly these
+_DATASET_CACHES = []
+
+
+class StaleWhileRevalidate:
+    """
+    Process-wide cache for one zero-argument loader.
+
+    - First call loads synchronously; concurrent first calls wait for that one load.
+    - Once older than `ttl`, the last good value is still returned immediately
+      while a single background thread reloads it.
+    - refresh() forces a reload; overlapping refresh requests share one load.
+    - A failed reload keeps the last good value; the failure is kept in `error`
+      until a later load succeeds.
+
+    The cached value is shared by every session: callers must not mutate it.
+    """
+
+    def __init__(self, loader, ttl, name=None):
+        self.loader = loader
+        self.ttl = ttl
+        self.name = name or loader.__name__
+
+        self._value = None
+        self._loaded_at = None
+        self._loading = False
+        self._generation = 0
+        self._error = None
+        self._cond = threading.Condition()
+
+    def get(self):
+        with self._cond:
+            if self._loaded_at is None:
+                self._start_load(background=False)
+                self._wait_for_load()
+                if self._loaded_at is None:
+                    raise self._error
+            elif self.age() > self.ttl:
+                self._start_load(background=True)
+            return self._value
+
+    def refresh(self, wait=True):
+        """Reload now. If a load is already in flight, join it instead of starting another."""
+        with self._cond:
+            self._start_load(background=True)
+            if wait:
+                self._wait_for_load()
+
+    def wait(self):
+        """Block until any in-flight load has finished."""
+        with self._cond:
+            self._wait_for_load()
+
+    @property
+    def error(self):
+        """Exception raised by the latest load if it failed, else None."""
+        return self._error
+
+    def age(self):
+        """Seconds since the cached value was loaded (None if never loaded)."""
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    # --- Single-flight loading ---
+    def _start_load(self, background):
+        # Caller holds self._cond
+        if self._loading:
+            return
+        self._loading = True
+
+        if background:
+            threading.Thread(target=self._load, name=f"swr-{self.name}", daemon=True).start()
+        else:
+            self._cond.release()
+            try:
+                self._load()
+            finally:
+                self._cond.acquire()
+
+    def _wait_for_load(self):
+        generation = self._generation
+        while self._loading and self._generation == generation:
+            self._cond.wait()
+
+    def _load(self):
+        try:
+            with span(f"data.load.{self.name}"):
+                value = self.loader()
+        except Exception as e:
+            logger.exception("Loading %s failed; serving the last good value if there is one", self.name)
+            with self._cond:
+                self._error = e
+                self._finish()
+            return
+
+        with self._cond:
+            self._value = value
+            self._loaded_at = time.monotonic()
+            self._error = None
+            self._finish()
+
+    def _finish(self):
+        self._loading = False
+        self._generation += 1
+        self._cond.notify_all()
+
+
+def stale_while_revalidate(ttl):
+    """Decorator: wrap a zero-argument dataset loader in a StaleWhileRevalidate cache."""
+    def decorator(loader):
+        cache = StaleWhileRevalidate(loader, ttl)
+        _DATASET_CACHES.append(cache)
+
+        @functools.wraps(loader)
+        def wrapper():
+            return cache.get()
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def refresh_datasets():
+    """
+    Reload every loaded dataset cache (and nothing else). Caches refresh in
+    registration order, so derived tables are rebuilt from fresh inputs.
+    Concurrent callers join the loads already in flight.
+    """
+    for cache in _DATASET_CACHES:
+        if cache.age() is not None:
+            cache.refresh(wait=True)
+
+
+def dataset_age():
+    """Age in seconds of the oldest loaded dataset, or None if nothing is loaded yet."""
+    ages = [cache.age() for cache in _DATASET_CACHES if cache.age() is not None]
+    return max(ages) if ages else None
+
+
+def dataset_error():
+    """The failure of the latest load of any loaded dataset, or None if they all succeeded."""
+    for cache in _DATASET_CACHES:
+        if cache.age() is not None and cache.error is not None:
+            return cache.error
+    return None
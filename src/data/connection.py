@@ -0,0 +1,131 @@
+import threading
+import time
+
+import streamlit as st
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from pymongo.monitoring import ConnectionPoolListener
+from config.settings import MONGO_USER
+from config.settings import MONGO_PASSWORD
+from config.settings import MONGO_PORT
+from config.settings import MONGO_HOST
+from config.settings import (
+    MONGO_MAX_POOL_SIZE,
+    MONGO_CONNECT_TIMEOUT_MS,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_SOCKET_TIMEOUT_MS,
+    MONGO_READ_PREFERENCE,
+)
+
+
+# MongoDB Connection
+MONGO_URL = (
+    f"mongodb://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}/"
+    "?authSource=admin"
+)
+
+
+class PoolStats(ConnectionPoolListener):
+    """Counts connection pool events so the health probe can report pool usage."""
+
+    def __init__(self):
+        self.open = 0
+        self.in_use = 0
+        self.checkout_failures = 0
+        self.clears = 0
+        self._lock = threading.Lock()
+
+    def _add(self, field, delta=1):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + delta)
+
+    def connection_created(self, event):
+        self._add("open")
+
+    def connection_closed(self, event):
+        self._add("open", -1)
+
+    def connection_checked_out(self, event):
+        self._add("in_use")
+
+    def connection_checked_in(self, event):
+        self._add("in_use", -1)
+
+    def connection_check_out_failed(self, event):
+        self._add("checkout_failures")
+
+    def pool_cleared(self, event):
+        self._add("clears")
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "open": self.open,
+                "in_use": self.in_use,
+                "checkout_failures": self.checkout_failures,
+                "clears": self.clears,
+            }
+
+
+@st.cache_resource
+def _client_resource():
+    """One MongoClient per process, created on first use rather than at import."""
+    pool_stats = PoolStats()
+    client = MongoClient(
+        MONGO_URL,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+        readPreference=MONGO_READ_PREFERENCE,
+        event_listeners=[pool_stats],
+    )
+    return client, pool_stats
+
+
+def get_client():
+    return _client_resource()[0]
+
+
+def get_collection():
+    return get_client()["students_db"]["student_stats"]
+
+
+def mongo_health():
+    """Ping the server and report latency, topology and connection pool state."""
+    client, pool_stats = _client_resource()
+    health = {
+        "ok": False,
+        "latency_ms": None,
+        "error": None,
+        "pool": {"max_size": MONGO_MAX_POOL_SIZE, **pool_stats.snapshot()},
+    }
+
+    start = time.perf_counter()
+    try:
+        client.admin.command("ping")
+        health["ok"] = True
+        health["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    except PyMongoError as e:
+        health["error"] = str(e)
+
+    health["servers"] = {
+        f"{host}:{port}": server.server_type_name
+        for (host, port), server in client.topology_description.server_descriptions().items()
+    }
+    return health
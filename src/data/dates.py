@@ -0,0 +1,40 @@
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Dates are stored as "day, dd.mm.yyyy" (e.g. "Sun, 01.02.2024")
+DATE_FORMAT = "%d.%m.%Y"
+
+
+def parse_day_dates(values):
+    """Vectorized parse of "day, dd.mm.yyyy" strings into datetime64; bad values become NaT."""
+    values = pd.Series(values, dtype="object")
+    date_part = values.where(values.map(lambda v: isinstance(v, str))).str.split(",", n=1).str[-1].str.strip()
+    return pd.to_datetime(date_part, format=DATE_FORMAT, errors="coerce")
+
+
+def add_parsed_dates(frame, sources):
+    """
+    Parse each {target_column: source_values} pair into a datetime64 column on
+    `frame`. Failures (present but unparsable values) are counted, logged and
+    recorded in frame.attrs["date_parse_failures"].
+    """
+    failures = {}
+
+    for target, source in sources.items():
+        source = pd.Series(source, index=frame.index, dtype="object")
+        parsed = parse_day_dates(source)
+        frame[target] = parsed
+
+        present = source.notna() & (source.astype(str).str.strip() != "")
+        failed = int((present & parsed.isna()).sum())
+        if failed:
+            failures[target] = failed
+
+    if failures:
+        logger.warning("Unparsable dates: %s", failures)
+
+    frame.attrs["date_parse_failures"] = {**frame.attrs.get("date_parse_failures", {}), **failures}
+    return frame
@@ -1,42 +1,90 @@
 
 import streamlit as st
-from pymongo import MongoClient
-import pandas as pd
-from config.settings import MONGO_USER
-from config.settings import MONGO_PASSWORD
-from config.settings import MONGO_PORT
-from config.settings import MONGO_HOST
+from data.connection import get_collection
+from data.sources import get_source
+from data.sync import StudentSync
+from data.aggregations import aggregate_teacher_summary
+from data.cache import stale_while_revalidate, refresh_datasets
+from data.shared_cache import invalidate_recent, shared_recent
+from config.settings import DATA_SOURCE, SYNC_MODE, SYNC_WATERMARK_FIELD, SYNC_INTERVAL_SECONDS
 
 
-# MongoDB Connection
-MONGO_URL = (
-    f"mongodb://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}/"
-    "?authSource=admin"
-)
+# Incremental sync follows the live collection, so it only applies to the Mongo source
+INCREMENTAL = SYNC_MODE == "incremental" and DATA_SOURCE == "mongo"
 
-client = MongoClient(MONGO_URL)
-db = client["students_db"]
-collection = db["student_stats"]
+# Replicas on one node reuse a collection load another replica made within this many
+# seconds (half the dataset TTL, so data is never more than one TTL older than before)
+SHARED_LOAD_MAX_AGE = 30
+_SHARED_LOADS = ("roster", "student_tables")
 
 
-# Load Data
-@st.cache_data(ttl=60)
-def load_students():
-    docs = list(collection.find())
+def _shared_load(name, load):
+    # Snapshots are memory-mapped, so replicas already share them through the page cache
+    if DATA_SOURCE != "mongo":
+        return load()
+    return shared_recent(name, SHARED_LOAD_MAX_AGE, load)
 
-    if not docs:
-        return pd.DataFrame()
 
-    for d in docs:
-        for lesson in d.get("lessons", []):
-            try:
-                lesson["practice_count"] = int(lesson["practice_count"])
-            except:
-                pass
+def reload_students():
+    """
+    Bring the student datasets up to date on demand (sidebar "Reload").
+    Only dataset caches are touched; concurrent reloads share one load.
+    """
+    if INCREMENTAL:
+        _student_sync().sync(force=True)
+    invalidate_recent(*_SHARED_LOADS)
+    refresh_datasets()
+    load_student.clear()
 
-    df = pd.DataFrame(docs)
 
-    if "_id" in df.columns:
-        df = df.drop(columns=["_id"])
+@st.cache_resource
+def _student_sync():
+    return StudentSync(
+        get_collection(),
+        watermark_field=SYNC_WATERMARK_FIELD,
+        interval=SYNC_INTERVAL_SECONDS,
+        full_interval=60,  # same as the full-mode dataset TTL
+    )
 
-    return df
\ No newline at end of file
+
+# Roster + per-student loading (Student Dashboard)
+def load_roster():
+    """Lightweight roster (no lessons) for the sidebar and the overview table."""
+    if INCREMENTAL:
+        return _student_sync().frame()
+    return _load_roster()
+
+
+@stale_while_revalidate(ttl=60)
+def _load_roster():
+    return _shared_load("roster", get_source().roster)
+
+
+@st.cache_data(ttl=60, max_entries=256)
+def load_student(student_id):
+    """Full document (with lessons) for one student, as a row Series; None if missing."""
+    return get_source().student(student_id)
+
+
+# Load Data (projected, columnar)
+def load_student_tables():
+    """
+    Return (students, lessons): a typed students table and a long-format
+    lessons table keyed by student_id, from a full reload or the incremental sync.
+    """
+    if INCREMENTAL:
+        return _student_sync().tables()
+    return _load_student_tables()
+
+
+@stale_while_revalidate(ttl=60)
+def _load_student_tables():
+    # Only the fields the pages use
+    return _shared_load("student_tables", get_source().student_tables)
+
+
+# Teacher summary (server-side aggregation)
+@stale_while_revalidate(ttl=60)
+def load_teacher_summary():
+    """Teacher summary computed by MongoDB; only the per-teacher result is transferred."""
+    return aggregate_teacher_summary(get_collection())
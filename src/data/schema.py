@@ -0,0 +1,93 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Compact in-memory dtypes. Every Streamlit process holds its own copy of the
+# dataset, so these directly bound per-replica memory.
+STRING = "string[pyarrow]"
+
+STUDENT_SCHEMA = {
+    "student_id": STRING,
+    "name": STRING,
+    "phone_number": STRING,
+    "current_lesson": "Int16",
+    "total_messages": "Int32",
+    "last_message_timedate": STRING,
+    "last_practice_timedate": STRING,
+    "last_practice_at": "datetime64[ns]",
+    "last_message_at": "datetime64[ns]",
+    "first_practice_at": "datetime64[ns]",
+}
+
+LESSON_SCHEMA = {
+    "student_id": STRING,
+    "position": "int16",
+    "lesson": "Int16",
+    "teacher": "category",
+    "practice_count": "Int16",
+    "first_practice": STRING,
+    "first_practice_at": "datetime64[ns]",
+}
+
+# Arrow -> pandas: strings stay Arrow-backed (no copy), integers become nullable
+# (otherwise a column with nulls turns into float64)
+_ARROW_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+}
+
+# Wider fallbacks for integer columns whose values do not fit the compact type
+_WIDER = {"Int16": "Int32", "Int32": "Int64", "int16": "int32", "int32": "int64"}
+
+
+def apply_schema(df, schema):
+    """Cast the columns present in `df` to their schema dtype, in place."""
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype == "category" and df[col].dtype != "category":
+            # An empty column is float64; its categories would be too
+            df[col] = df[col].astype(object)
+        df[col] = df[col].astype(_fitting_int(df[col], dtype))
+    return df
+
+
+def _fitting_int(series, dtype):
+    """Smallest of dtype / its wider fallbacks that holds every value of an integer column."""
+    if dtype not in _WIDER:
+        return dtype
+    values = series.dropna()
+    if values.empty:
+        return dtype
+    return fitting_int(values.min(), values.max(), dtype)
+
+
+def fitting_int(low, high, dtype):
+    """Smallest of dtype / its wider fallbacks whose range covers [low, high]."""
+    while dtype in _WIDER:
+        info = np.iinfo(dtype.lower())
+        if low >= info.min and high <= info.max:
+            return dtype
+        dtype = _WIDER[dtype]
+    return dtype
+
+
+def arrow_to_pandas(table, **kwargs):
+    """Convert an Arrow table without materializing strings as Python objects."""
+    return table.to_pandas(types_mapper=_ARROW_TYPES.get, **kwargs)
+
+
+def memory_footprint(df):
+    """Deep memory usage of a frame in bytes."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def log_footprint(name, df):
+    logger.info("%s: %d rows, %.1f MB", name, len(df), memory_footprint(df) / 1024 / 1024)
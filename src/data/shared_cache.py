@@ -0,0 +1,295 @@
+"""
+Shared cache tier for replicas on the same node.
+
+st.cache_data / cache_resource and the dataset caches are per process, so
+every replica decodes the collection and recomputes the same aggregates.
+Values stored here are visible to every process using the same backend:
+
+- shared_value(namespace, version, compute): derived tables, computed once
+  per dataset version by whichever replica gets there first.
+- shared_recent(namespace, max_age, compute): the latest result of a load,
+  reused by other replicas while it is younger than `max_age` seconds.
+
+Backends store bytes under string keys (SHARED_CACHE: "off" or "disk").
+DiskCache writes atomically (temp file + rename) and evicts the least
+recently used entries once the directory grows past its size cap.
+"""
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+import streamlit as st
+
+from config.settings import SHARED_CACHE, SHARED_CACHE_MAX_MB, SHARED_CACHE_PATH
+from telemetry.spans import span
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, replicas may compute the same value concurrently
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class SharedCacheError(Exception):
+    """The cache directory is not safe to use."""
+
+
+class NullCache:
+    """Backend for SHARED_CACHE=off: never stores anything."""
+
+    enabled = False
+
+    def get(self, key):
+        return None
+
+    def put(self, key, data):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def lock(self, key):
+        return contextlib.nullcontext()
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        return {"backend": "off"}
+
+
+class DiskCache:
+    """
+    Byte store in a directory shared by the processes of one node.
+
+    - Writes go to a temp file in the same directory and are renamed into place,
+      so readers see either the old entry or the complete new one.
+    - Reads bump the entry's mtime; eviction removes the oldest mtimes first
+      until the directory is back under `low_water` of `max_bytes`.
+
+    Entries are unpickled by every process using the directory, so it is created
+    private (0700) and refused if another user owns it or can write to it.
+    """
+
+    enabled = True
+    low_water = 0.9
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._written = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        _check_private(path)
+        os.makedirs(os.path.join(path, "locks"), mode=0o700, exist_ok=True)
+
+    def _file(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.path, digest[:2], digest)
+
+    def get(self, key):
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:  # never written, or evicted by another process
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp)
+            raise
+
+        with self._lock:
+            self._written += len(data)
+            # Scanning the directory is the expensive part: only do it once enough new bytes arrived
+            if self._written < self.max_bytes * (1 - self.low_water):
+                return
+            self._written = 0
+        self.evict()
+
+    def delete(self, key):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._file(key))
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Cross-process lock for computing `key`, so one replica computes while the others wait."""
+        if fcntl is None:
+            yield
+            return
+        path = os.path.join(self.path, "locks", os.path.basename(self._file(key)))
+        with open(path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            os.utime(path)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _entries(self):
+        """(mtime, size, path) of every stored entry; stale temp files of crashed writers are removed."""
+        entries = []
+        now = time.time()
+        for shard in os.scandir(self.path):
+            if not shard.is_dir() or shard.name == "locks":
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    if now - stat.st_mtime > 3600:
+                        with contextlib.suppress(FileNotFoundError):
+                            os.remove(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        # Lock files of old dataset versions are never used again
+        now = time.time()
+        for entry in os.scandir(os.path.join(self.path, "locks")):
+            with contextlib.suppress(FileNotFoundError):
+                if now - entry.stat().st_mtime > 86400:
+                    os.remove(entry.path)
+
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * self.low_water
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    def stats(self):
+        entries = self._entries()
+        return {
+            "backend": "disk",
+            "path": self.path,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _check_private(path):
+    """Refuse a directory another user could plant entries in."""
+    if not hasattr(os, "getuid"):  # Windows: rely on the directory ACLs
+        return
+    info = os.stat(path)
+    if info.st_uid != os.getuid():
+        raise SharedCacheError(f"{path} is owned by uid {info.st_uid}, not by this process (uid {os.getuid()})")
+    if info.st_mode & 0o022:
+        raise SharedCacheError(f"{path} is writable by other users (mode {info.st_mode & 0o777:o})")
+
+
+SHARED_CACHE_BACKENDS = {
+    "off": lambda: NullCache(),
+    "disk": lambda: DiskCache(SHARED_CACHE_PATH, SHARED_CACHE_MAX_MB * 1024 * 1024),
+}
+
+
+@st.cache_resource
+def get_shared_cache():
+    """Shared cache backend selected by SHARED_CACHE; disabled if its directory is not safe."""
+    try:
+        return SHARED_CACHE_BACKENDS[SHARED_CACHE]()
+    except SharedCacheError as e:
+        logger.error("Shared cache disabled: %s", e)
+        return NullCache()
+
+
+# --- Values on top of the byte store ---
+def _loads(data):
+    if data is None:
+        return _MISSING
+    try:
+        return pickle.loads(data)
+    except Exception:
+        # Written by an incompatible version of the code: recompute
+        logger.warning("Dropping unreadable shared cache entry", exc_info=True)
+        return _MISSING
+
+
+def _fetch(cache, key, fresh):
+    entry = _loads(cache.get(key))
+    if entry is _MISSING or not fresh(entry[0]):
+        return _MISSING
+    return entry[1]
+
+
+def _get_or_compute(key, compute, fresh=lambda created: True):
+    cache = get_shared_cache()
+    if not cache.enabled:
+        return compute()
+
+    with span(f"data.shared.{key.split('/')[0]}"):
+        value = _fetch(cache, key, fresh)
+        if value is not _MISSING:
+            return value
+
+        with cache.lock(key):
+            # Another process may have stored it while we waited for the lock
+            value = _fetch(cache, key, fresh)
+            if value is not _MISSING:
+                return value
+
+            value = compute()
+            cache.put(key, pickle.dumps((time.time(), value), protocol=pickle.HIGHEST_PROTOCOL))
+            return value
+
+
+def shared_value(namespace, version, compute):
+    """compute() once per (namespace, dataset version) across every process sharing the cache."""
+    return _get_or_compute(f"{namespace}/{version}", compute)
+
+
+def shared_recent(namespace, max_age, compute):
+    """The last compute() result stored by any process, if younger than `max_age` seconds; else compute() now."""
+    return _get_or_compute(f"{namespace}/latest", compute, fresh=lambda created: time.time() - created < max_age)
+
+
+def invalidate_recent(*namespaces):
+    """Forget shared_recent results, e.g. before a user-requested reload."""
+    cache = get_shared_cache()
+    for namespace in namespaces:
+        cache.delete(f"{namespace}/latest")
@@ -0,0 +1,153 @@
+"""
+Columnar snapshot of the student collection: the typed students and lessons
+tables written as uncompressed Arrow IPC (Feather v2) files, which are read
+back through memory mapping. Processes reading the same snapshot share the OS
+page cache, and nothing needs MongoDB.
+
+Dump the current collection:
+    python -m data.snapshot dump --path snapshot
+    python -m data.snapshot info --path snapshot
+"""
+import argparse
+import json
+import os
+import threading
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from data.schema import LESSON_SCHEMA, STUDENT_SCHEMA, apply_schema, arrow_to_pandas
+from data.streaming import stream_student_tables
+from data.tables import STUDENT_PROJECTION, dataset_version, students_frame_from_tables
+
+STUDENTS_FILE = "students.arrow"
+LESSONS_FILE = "lessons.arrow"
+
+
+class SnapshotError(RuntimeError):
+    pass
+
+
+def write_snapshot(docs, path, batch_size=2000):
+    """
+    Write (students, lessons) tables built from `docs` under directory `path`.
+    Each file is written to a temp name and renamed into place; both carry the
+    same version so readers can detect a half-replaced snapshot.
+    """
+    students, lessons = stream_student_tables(docs, batch_size)
+    version = dataset_version(students)
+    created_at = datetime.now(timezone.utc).isoformat()
+
+    os.makedirs(path, exist_ok=True)
+    for name, frame in ((LESSONS_FILE, lessons), (STUDENTS_FILE, students)):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **table.schema.metadata,
+            b"version": version.encode(),
+            b"created_at": created_at.encode(),
+        })
+        target = os.path.join(path, name)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, target)
+
+    return {"version": version, "created_at": created_at, "students": len(students), "lessons": len(lessons)}
+
+
+def read_table(file_path):
+    """Memory-map one snapshot file; returns (frame, schema metadata)."""
+    # The mapping stays alive as long as the frame's buffers reference it
+    table = pa.ipc.open_file(pa.memory_map(file_path, "r")).read_all()
+    metadata = {k.decode(): v.decode() for k, v in table.schema.metadata.items() if k != b"pandas"}
+    return arrow_to_pandas(table), metadata
+
+
+class SnapshotSource:
+    """
+    Data source reading a snapshot directory written by write_snapshot().
+    The tables are re-read only when the snapshot files change on disk.
+    """
+
+    name = "snapshot"
+
+    def __init__(self, path):
+        self.path = path
+        self._loaded = None  # (mtimes, students, lessons, version)
+        self._lesson_rows = None
+        self._lock = threading.Lock()
+
+    def _tables(self):
+        files = [os.path.join(self.path, name) for name in (STUDENTS_FILE, LESSONS_FILE)]
+        try:
+            mtimes = tuple(os.stat(f).st_mtime_ns for f in files)
+        except FileNotFoundError as e:
+            raise SnapshotError(f"No snapshot at {self.path!r}; create one with `python -m data.snapshot dump`") from e
+
+        with self._lock:
+            if self._loaded is None or self._loaded[0] != mtimes:
+                students, student_meta = read_table(files[0])
+                lessons, lesson_meta = read_table(files[1])
+                if student_meta.get("version") != lesson_meta.get("version"):
+                    raise SnapshotError(f"Snapshot at {self.path!r} is being replaced; try again")
+
+                # Nullable integer mapping on read; restore the exact compact dtypes
+                apply_schema(students, STUDENT_SCHEMA)
+                apply_schema(lessons, LESSON_SCHEMA)
+
+                version = student_meta["version"]
+                students.attrs["version"] = version
+                lessons.attrs["version"] = version
+                self._loaded = (mtimes, students, lessons, version)
+                self._lesson_rows = None
+            return self._loaded[1:]
+
+    def info(self):
+        students, lessons, version = self._tables()
+        return {"path": self.path, "version": version, "students": len(students), "lessons": len(lessons)}
+
+    def roster(self):
+        students, _, _ = self._tables()
+        return students
+
+    def student_tables(self):
+        students, lessons, _ = self._tables()
+        return students, lessons
+
+    def student(self, student_id):
+        students, lessons, version = self._tables()
+        match = students.index[students["student_id"] == student_id]
+        if match.empty:
+            return None
+
+        with self._lock:
+            if self._lesson_rows is None:
+                self._lesson_rows = lessons.groupby("student_id", sort=False, observed=True).indices
+            rows = self._lesson_rows.get(student_id, [])
+
+        frame = students_frame_from_tables(students.loc[match], lessons.iloc[rows], version)
+        return frame.iloc[0]
+
+
+# --- CLI ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m data.snapshot", description=__doc__.split("\n\n")[0])
+    parser.add_argument("command", choices=["dump", "info"])
+    parser.add_argument("--path", default=None, help="snapshot directory (default: SNAPSHOT_PATH)")
+    args = parser.parse_args(argv)
+
+    from config.settings import SNAPSHOT_PATH
+    path = args.path or SNAPSHOT_PATH
+
+    if args.command == "dump":
+        from data.connection import get_collection
+        from config.settings import MONGO_BATCH_SIZE
+        summary = write_snapshot(get_collection().find({}, STUDENT_PROJECTION), path, MONGO_BATCH_SIZE)
+    else:
+        summary = SnapshotSource(path).info()
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import streamlit as st
+from bson import ObjectId
+from config.settings import DATA_SOURCE, MONGO_BATCH_SIZE, SNAPSHOT_PATH
+from data.connection import get_collection, mongo_health
+from data.snapshot import SnapshotSource
+from data.streaming import stream_student_tables
+from data.tables import STUDENT_PROJECTION, ROSTER_PROJECTION, build_students_frame
+
+
+class MongoSource:
+    """
+    Data source reading the live `student_stats` collection. Bulk loads stream
+    the cursor in MONGO_BATCH_SIZE chunks, so the raw documents are never all
+    held in memory at once.
+    """
+
+    name = "mongo"
+
+    def info(self):
+        return mongo_health()
+
+    def roster(self):
+        students, _ = stream_student_tables(get_collection().find({}, ROSTER_PROJECTION), MONGO_BATCH_SIZE)
+        return students
+
+    def student_tables(self):
+        return stream_student_tables(get_collection().find({}, STUDENT_PROJECTION), MONGO_BATCH_SIZE)
+
+    def student(self, student_id):
+        key = ObjectId(student_id) if ObjectId.is_valid(student_id) else student_id
+        doc = get_collection().find_one({"_id": key})
+        if doc is None:
+            return None
+        return build_students_frame([doc]).iloc[0]
+
+
+# Every source provides info(), roster(), student_tables() and student(student_id)
+SOURCES = {
+    "mongo": MongoSource,
+    "snapshot": lambda: SnapshotSource(SNAPSHOT_PATH),
+}
+
+
+@st.cache_resource
+def get_source():
+    """The configured DATA_SOURCE, one instance per process."""
+    return SOURCES[DATA_SOURCE]()
@@ -0,0 +1,142 @@
+import itertools
+
+from collections import Counter
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from data.dates import add_parsed_dates
+from data.schema import LESSON_SCHEMA, STRING, STUDENT_SCHEMA, apply_schema, arrow_to_pandas, fitting_int, log_footprint
+from data.tables import (
+    LESSON_INT_COLUMNS,
+    STUDENT_INT_COLUMNS,
+    _to_int,
+    collect_columns,
+    table_fingerprint,
+)
+
+# Intermediate Arrow layout of one decoded chunk. Integers stay 64-bit until
+# the whole table is known, then they are narrowed to the data/schema.py dtypes.
+STUDENT_ARROW_SCHEMA = pa.schema([
+    ("student_id", pa.string()),
+    ("name", pa.string()),
+    ("phone_number", pa.string()),
+    ("current_lesson", pa.int64()),
+    ("total_messages", pa.int64()),
+    ("last_message_timedate", pa.string()),
+    ("last_practice_timedate", pa.string()),
+    ("last_practice_at", pa.timestamp("ns")),
+    ("last_message_at", pa.timestamp("ns")),
+])
+
+LESSON_ARROW_SCHEMA = pa.schema([
+    ("student_id", pa.string()),
+    ("position", pa.int64()),
+    ("lesson", pa.int64()),
+    ("teacher", pa.dictionary(pa.int32(), pa.string())),
+    ("practice_count", pa.int64()),
+    ("first_practice", pa.string()),
+    ("first_practice_at", pa.timestamp("ns")),
+])
+
+
+def stream_student_tables(docs, batch_size=2000):
+    """
+    Streaming equivalent of build_student_tables: documents are read
+    `batch_size` at a time, each chunk is decoded into Arrow record batches
+    and dropped, so neither the raw documents nor per-value Python objects
+    for the whole collection are ever held at once.
+    Returns the same (students, lessons) frames, with the same dtypes and version.
+    """
+    if hasattr(docs, "batch_size"):
+        docs = docs.batch_size(batch_size)  # server round trips match the chunk size
+
+    student_batches, lesson_batches = [], []
+    failures = Counter()
+
+    docs = iter(docs)
+    while chunk := list(itertools.islice(docs, batch_size)):
+        students, lessons, chunk_failures = _decode_chunk(chunk)
+        student_batches.append(students)
+        lesson_batches.append(lessons)
+        failures.update(chunk_failures)
+
+    students = _finish(student_batches, STUDENT_ARROW_SCHEMA, STUDENT_SCHEMA)
+    lessons = _finish(lesson_batches, LESSON_ARROW_SCHEMA, LESSON_SCHEMA)
+
+    version = table_fingerprint(students, lessons)
+    for frame in (students, lessons):
+        frame.attrs["version"] = version
+    students.attrs["date_parse_failures"] = {
+        col: n for col, n in failures.items() if col in students.columns
+    }
+    lessons.attrs["date_parse_failures"] = {
+        col: n for col, n in failures.items() if col in lessons.columns
+    }
+
+    log_footprint("students table", students)
+    log_footprint("lessons table", lessons)
+    return students, lessons
+
+
+def _decode_chunk(chunk):
+    """One chunk of documents -> (students batch, lessons batch, date parse failures)."""
+    student_cols, lesson_cols = collect_columns(chunk)
+    students = _typed_chunk(pd.DataFrame(student_cols), STUDENT_INT_COLUMNS, STUDENT_ARROW_SCHEMA)
+    lessons = _typed_chunk(pd.DataFrame(lesson_cols), LESSON_INT_COLUMNS, LESSON_ARROW_SCHEMA)
+
+    add_parsed_dates(students, {
+        "last_practice_at": students["last_practice_timedate"],
+        "last_message_at": students["last_message_timedate"],
+    })
+    add_parsed_dates(lessons, {"first_practice_at": lessons["first_practice"]})
+
+    failures = {**students.attrs["date_parse_failures"], **lessons.attrs["date_parse_failures"]}
+    return (
+        pa.RecordBatch.from_pandas(students, schema=STUDENT_ARROW_SCHEMA, preserve_index=False),
+        pa.RecordBatch.from_pandas(lessons, schema=LESSON_ARROW_SCHEMA, preserve_index=False),
+        failures,
+    )
+
+
+def _typed_chunk(frame, int_columns, arrow_schema):
+    for col in int_columns:
+        frame[col] = _to_int(frame[col])
+    for field in arrow_schema:
+        if field.name not in frame.columns:
+            continue
+        if field.type == pa.string():
+            frame[field.name] = frame[field.name].astype(STRING)
+        elif pa.types.is_dictionary(field.type):
+            frame[field.name] = frame[field.name].astype(STRING).astype("category")
+    return frame
+
+
+def _finish(batches, arrow_schema, schema):
+    """
+    Record batches of all chunks -> pandas frame in the compact schema.
+    Consumes `batches`; Arrow buffers are released column by column as they
+    are converted, so the table and the frame are not both held in full.
+    """
+    table = pa.Table.from_batches(batches, arrow_schema).unify_dictionaries()
+    batches.clear()
+
+    for i, field in enumerate(table.schema):
+        target = schema.get(field.name)
+        if pa.types.is_integer(field.type) and target:
+            bounds = pc.min_max(table.column(i)).as_py()
+            if bounds["min"] is not None:
+                target = fitting_int(bounds["min"], bounds["max"], target)
+            table = table.set_column(i, field.name, table.column(i).cast(pa.from_numpy_dtype(target.lower())))
+
+    frame = arrow_to_pandas(table, self_destruct=True, split_blocks=True)
+    del table
+    frame = apply_schema(frame, schema)
+
+    for col, dtype in schema.items():
+        if dtype == "category":
+            # Same sorted, object-dtype categories as build_student_tables
+            categories = sorted(frame[col].cat.categories.astype(object))
+            frame[col] = frame[col].cat.set_categories(pd.Index(categories, dtype=object))
+    return frame
@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+
+from pymongo.errors import PyMongoError
+
+from data.tables import build_student_tables, build_students_frame
+
+logger = logging.getLogger(__name__)
+
+
+class StudentSync:
+    """
+    Keeps the last materialized student dataset in memory and brings it up to
+    date with deltas instead of re-reading the whole collection.
+
+    Changes are picked up from a change stream when the server supports one
+    (replica sets), otherwise by querying documents whose `watermark_field`
+    moved past the highest value seen so far. Deletions, and inserts without a
+    watermark value, are detected by diffing an `_id`-only scan, which is
+    served from the `_id` index. Updates that do not move the watermark are
+    only picked up from a change stream or a forced sync, which reloads in full.
+
+    Without either (no change stream, no watermark values) every sync is a full
+    reload, so it runs every `full_interval` seconds instead of `interval`.
+    """
+
+    def __init__(self, collection, projection=None, watermark_field="updated_at",
+                 interval=10, full_interval=60, use_change_stream=True):
+        self.collection = collection
+        self.projection = projection
+        self.watermark_field = watermark_field
+        self.interval = interval
+        self.full_interval = full_interval
+        self.use_change_stream = use_change_stream
+
+        self.version = 0
+        self._docs = {}
+        self._watermark = None
+        self._stream = None
+        self._frame = None
+        self._tables = None
+        self._last_sync = 0.0
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def frame(self):
+        """Return the current dataset as a DataFrame, syncing if it is due."""
+        self.sync()
+        return self._frame
+
+    def tables(self):
+        """
+        Return the current dataset as (students, lessons) tables, syncing if it
+        is due. Built from the synced documents once per change, on first use.
+        """
+        self.sync()
+        with self._lock:
+            if self._tables is None:
+                self._tables = build_student_tables(list(self._docs.values()))
+            return self._tables
+
+    def sync(self, force=False):
+        """
+        Apply pending changes. Returns True if the dataset changed.
+        `force` (user-requested reload) ignores the interval and reloads in full.
+        """
+        with self._lock:
+            if not force and self._frame is not None and time.monotonic() - self._last_sync < self._interval():
+                return False
+
+            if self._frame is None or force:
+                changed = self._full_load()
+            elif self._stream is not None:
+                changed = self._apply_stream()
+            elif self._watermark is not None:
+                changed = self._apply_delta()
+            else:
+                # No watermark field on the documents: nothing to diff against
+                changed = self._full_load()
+
+            self._last_sync = time.monotonic()
+            if changed or self._frame is None:
+                self.version += 1
+                self._frame = build_students_frame(list(self._docs.values()))
+                self._tables = None
+            return changed
+
+    # --- Loading strategies ---
+    def _full_load(self):
+        self._stream = self._open_stream()
+        docs = {doc["_id"]: doc for doc in self.collection.find({}, self.projection)}
+        changed = docs != self._docs
+        self._docs = docs
+        self._watermark = self._max_watermark(docs.values())
+
+        if self._stream is None and self._watermark is None and not self._warned:
+            self._warned = True
+            logger.warning(
+                "Incremental sync unavailable (no change stream, no %r values): "
+                "reloading the whole collection every %ss",
+                self.watermark_field, self.full_interval,
+            )
+        return changed
+
+    def _apply_delta(self):
+        changed = False
+
+        for doc in self.collection.find({self.watermark_field: {"$gte": self._watermark}}, self.projection):
+            if self._docs.get(doc["_id"]) != doc:
+                self._docs[doc["_id"]] = doc
+                changed = True
+            self._watermark = max(self._watermark, doc.get(self.watermark_field, self._watermark))
+
+        live_ids = {doc["_id"] for doc in self.collection.find({}, {"_id": 1})}
+        for deleted_id in self._docs.keys() - live_ids:
+            del self._docs[deleted_id]
+            changed = True
+
+        # Inserts without a watermark value never match the query above; the _id diff finds them
+        new_ids = list(live_ids - self._docs.keys())
+        if new_ids:
+            for doc in self.collection.find({"_id": {"$in": new_ids}}, self.projection):
+                self._docs[doc["_id"]] = doc
+            changed = True
+
+        return changed
+
+    def _apply_stream(self):
+        changed = False
+        try:
+            while True:
+                event = self._stream.try_next()
+                if event is None:
+                    break
+
+                doc_id = event["documentKey"]["_id"]
+                operation = event["operationType"]
+
+                if operation == "delete":
+                    changed = self._docs.pop(doc_id, None) is not None or changed
+                elif operation in ("insert", "update", "replace") and event.get("fullDocument"):
+                    self._docs[doc_id] = event["fullDocument"]
+                    changed = True
+                elif operation in ("drop", "rename", "invalidate"):
+                    return self._full_load()
+
+        except PyMongoError:
+            # Stream lost (e.g. resume token expired): start over from a full load
+            return self._full_load()
+
+        return changed
+
+    # --- Helpers ---
+    def _interval(self):
+        if self._stream is None and self._watermark is None:
+            return self.full_interval
+        return self.interval
+
+    def _open_stream(self):
+        if self._stream is not None:
+            self._stream.close()
+
+        if not self.use_change_stream:
+            return None
+
+        try:
+            return self.collection.watch(full_document="updateLookup")
+        except (PyMongoError, NotImplementedError, TypeError):
+            # Standalone servers and mongomock have no change streams
+            return None
+
+    def _max_watermark(self, docs):
+        values = [doc[self.watermark_field] for doc in docs if doc.get(self.watermark_field) is not None]
+        return max(values) if values else None
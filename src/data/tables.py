@@ -0,0 +1,198 @@
+import hashlib
+import pickle
+
+import pandas as pd
+
+from data.dates import add_parsed_dates
+from data.schema import LESSON_SCHEMA, STUDENT_SCHEMA, apply_schema, log_footprint
+
+
+# Student-level fields the pages actually read
+STUDENT_FIELDS = [
+    "name",
+    "phone_number",
+    "current_lesson",
+    "total_messages",
+    "last_message_timedate",
+    "last_practice_timedate",
+]
+
+# Per-lesson fields, flattened out of the nested `lessons` array
+LESSON_FIELDS = ["lesson", "teacher", "practice_count", "first_practice"]
+
+# Mongo projection: only ask the server for what we use
+STUDENT_PROJECTION = {
+    **{field: 1 for field in STUDENT_FIELDS},
+    **{f"lessons.{field}": 1 for field in LESSON_FIELDS},
+}
+
+# Roster: the scalar fields the sidebar and overview need, no lessons
+ROSTER_FIELDS = ["name", "phone_number", "current_lesson", "total_messages", "last_practice_timedate"]
+ROSTER_PROJECTION = {field: 1 for field in ROSTER_FIELDS}
+
+# Numeric columns coerced before the compact dtypes in data/schema.py are applied
+STUDENT_INT_COLUMNS = ["current_lesson", "total_messages"]
+LESSON_INT_COLUMNS = ["lesson", "practice_count"]
+
+
+def build_student_tables(docs):
+    """
+    Decode raw student documents into two typed frames:
+      students: one row per student, keyed by student_id
+      lessons:  one row per lesson (student_id, position, lesson, teacher,
+                practice_count, first_practice), in the original lesson order
+    Malformed numbers become <NA> instead of raising; date strings are parsed
+    into *_at datetime64 columns. Both frames carry the same attrs["version"].
+    """
+    student_cols, lesson_cols = collect_columns(docs)
+
+    students = _type_students(pd.DataFrame(student_cols))
+    lessons = _type_lessons(pd.DataFrame(lesson_cols))
+
+    add_parsed_dates(students, {
+        "last_practice_at": students["last_practice_timedate"],
+        "last_message_at": students["last_message_timedate"],
+    })
+    add_parsed_dates(lessons, {"first_practice_at": lessons["first_practice"]})
+
+    version = table_fingerprint(students, lessons)
+    students.attrs["version"] = version
+    lessons.attrs["version"] = version
+
+    log_footprint("students table", students)
+    log_footprint("lessons table", lessons)
+    return students, lessons
+
+
+def collect_columns(docs):
+    """Flatten documents into plain column lists: (student columns, lesson columns)."""
+    student_cols = {"student_id": [], **{field: [] for field in STUDENT_FIELDS}}
+    lesson_cols = {"student_id": [], "position": [], **{field: [] for field in LESSON_FIELDS}}
+
+    for doc in docs:
+        student_id = str(doc.get("_id"))
+        student_cols["student_id"].append(student_id)
+        for field in STUDENT_FIELDS:
+            student_cols[field].append(doc.get(field))
+
+        for position, lesson in enumerate(doc.get("lessons") or []):
+            lesson_cols["student_id"].append(student_id)
+            lesson_cols["position"].append(position)
+            for field in LESSON_FIELDS:
+                lesson_cols[field].append(lesson.get(field))
+
+    return student_cols, lesson_cols
+
+
+def build_students_frame(docs, with_lessons=True):
+    """
+    Build the wide students DataFrame the pages render from: one row per
+    student with the nested `lessons` list kept as-is and practice counts
+    coerced to int where possible. Input documents are not modified.
+    With with_lessons=False (roster documents) no lessons column is added.
+    """
+    if not docs:
+        frame = pd.DataFrame()
+        frame.attrs["version"] = fingerprint([])
+        return frame
+
+    rows = []
+    for doc in docs:
+        row = {"student_id": str(doc.get("_id"))}
+        row.update((key, value) for key, value in doc.items() if key != "_id")
+        if with_lessons:
+            row["lessons"] = [_coerce_practice_count(lesson) for lesson in doc.get("lessons", [])]
+        rows.append(row)
+
+    frame = pd.DataFrame(rows)
+    frame.attrs["version"] = fingerprint(docs)
+
+    # Parse date strings once here so render code only does date arithmetic
+    dates = {
+        "last_practice_at": frame.get("last_practice_timedate"),
+        "last_message_at": frame.get("last_message_timedate"),
+    }
+    if with_lessons:
+        dates["first_practice_at"] = frame["lessons"].map(_first_practice)
+    add_parsed_dates(frame, dates)
+
+    for col in STUDENT_INT_COLUMNS:
+        if col in frame.columns:
+            frame[col] = _to_int(frame[col])
+    apply_schema(frame, STUDENT_SCHEMA)
+
+    log_footprint("students frame", frame)
+    return frame
+
+
+def _first_practice(lessons):
+    # Not .str[0].str.get(...): that raises when no row has a lesson
+    return lessons[0].get("first_practice") if lessons else None
+
+
+def students_frame_from_tables(students, lessons, version):
+    """
+    Rebuild the wide frame (nested `lessons` lists) from the typed tables, for
+    sources that store tables rather than documents. Missing values become None.
+    """
+    fields = lessons[LESSON_FIELDS].astype(object)
+    records = fields.where(fields.notna(), None).to_dict("records")
+
+    by_student = {}
+    for student_id, record in zip(lessons["student_id"], records):
+        by_student.setdefault(student_id, []).append(record)
+
+    frame = students.copy()
+    frame["lessons"] = [by_student.get(student_id, []) for student_id in frame["student_id"]]
+
+    # Already parsed in the lessons table: the first lesson's date, NaT for students without lessons
+    first = lessons.loc[lessons["position"] == 0].set_index("student_id")["first_practice_at"]
+    frame["first_practice_at"] = frame["student_id"].map(first).to_numpy()
+    apply_schema(frame, STUDENT_SCHEMA)
+    frame.attrs["version"] = version
+    return frame
+
+
+def fingerprint(docs):
+    """Content hash of a list of documents: changes only when the data does."""
+    return hashlib.blake2b(pickle.dumps(docs, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).hexdigest()
+
+
+def table_fingerprint(*frames):
+    """Content hash of typed tables; vectorized, so cheaper than hashing the documents."""
+    digest = hashlib.blake2b(digest_size=16)
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def dataset_version(df):
+    """Version token stamped on a loaded students frame (see build_students_frame)."""
+    return df.attrs["version"]
+
+
+def _coerce_practice_count(lesson):
+    lesson = dict(lesson)
+    try:
+        lesson["practice_count"] = int(lesson["practice_count"])
+    except:
+        pass
+    return lesson
+
+
+def _type_students(students):
+    for col in STUDENT_INT_COLUMNS:
+        students[col] = _to_int(students[col])
+    return apply_schema(students, STUDENT_SCHEMA)
+
+
+def _type_lessons(lessons):
+    for col in LESSON_INT_COLUMNS:
+        lessons[col] = _to_int(lessons[col])
+    return apply_schema(lessons, LESSON_SCHEMA)
+
+
+def _to_int(series):
+    """Coerce a column to nullable integers; anything unparsable becomes <NA>."""
+    numeric = pd.to_numeric(series, errors="coerce")
+    return numeric.where(numeric.isna() | (numeric == numeric.round())).astype("Int64")
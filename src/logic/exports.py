@@ -0,0 +1,140 @@
+import io
+import logging
+import re
+import threading
+import time
+import zipfile
+
+import pandas as pd
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Display / export column names of a teacher's student list
+STUDENT_TABLE_COLUMNS = {
+    "name": "Student Name",
+    "current_lesson": "Current Lesson",
+    "phone": "Phone Number",
+    "last_practice": "Last Practice",
+}
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+
+def student_table(student_list):
+    """A teacher's current or past students as a display-ready DataFrame."""
+    return pd.DataFrame(student_list, columns=list(STUDENT_TABLE_COLUMNS)).rename(columns=STUDENT_TABLE_COLUMNS)
+
+
+def leaderboard_table(teacher_data):
+    """Leaderboard rows ranked by practices checked, with medals for the top 3."""
+    leaderboard = [
+        {
+            "Teacher": teacher,
+            "Practices Checked": data["total_practices"],
+            "Current Students": len(data["current"]),
+            "Past Students": len(data["past"]),
+            "Total Students": len(data["current"]) + len(data["past"]),
+        }
+        for teacher, data in teacher_data.items()
+    ]
+
+    df = pd.DataFrame(leaderboard)
+    df = df.sort_values("Practices Checked", ascending=False)
+    df.insert(0, "Rank", range(1, len(df) + 1))
+
+    df["Rank"] = df["Rank"].apply(_add_medal)
+    return df
+
+
+# --- Per-table downloads: serialized on click, cached per dataset version ---
+@st.cache_data(max_entries=256)
+def teacher_roster_csv(version, teacher, kind, _teacher_data):
+    """CSV bytes of one teacher's "current" or "past" students."""
+    return student_table(_teacher_data[teacher][kind]).to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=8)
+def leaderboard_csv(version, _teacher_data):
+    return leaderboard_table(_teacher_data).to_csv(index=False).encode("utf-8")
+
+
+# --- Bulk export: every teacher's rosters in one zip, built off the script thread ---
+def build_bulk_export(teacher_data, fmt="csv"):
+    """Zip of `<teacher>/current.<fmt>` and `<teacher>/past.<fmt>` for every teacher, plus the leaderboard."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f"leaderboard.{fmt}", _serialize(leaderboard_table(teacher_data), fmt))
+        for teacher in sorted(teacher_data):
+            folder = _safe_filename(teacher)
+            for kind in ("current", "past"):
+                table = student_table(teacher_data[teacher][kind])
+                archive.writestr(f"{folder}/{kind}.{fmt}", _serialize(table, fmt))
+    return buffer.getvalue()
+
+
+class BulkExporter:
+    """
+    Builds bulk export zips in background threads, one per (dataset version,
+    format). Jobs for older versions are dropped when a newer one is requested.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def job(self, version, fmt):
+        """Job dict (status "running" / "ready" / "failed", data, error, seconds) or None."""
+        with self._lock:
+            return self._jobs.get((version, fmt))
+
+    def request(self, teacher_data, fmt):
+        """Start building the export unless it is already built or in progress."""
+        key = (teacher_data.version, fmt)
+        with self._lock:
+            if key in self._jobs and self._jobs[key]["status"] != "failed":
+                return self._jobs[key]
+
+            self._jobs = {k: job for k, job in self._jobs.items() if k[0] == teacher_data.version}
+            job = self._jobs[key] = {"status": "running", "data": None, "error": None, "seconds": None}
+
+        threading.Thread(
+            target=self._build, args=(job, teacher_data, fmt), name=f"bulk-export-{fmt}", daemon=True
+        ).start()
+        return job
+
+    def _build(self, job, teacher_data, fmt):
+        start = time.perf_counter()
+        try:
+            data = build_bulk_export(teacher_data, fmt)
+        except Exception as e:
+            logger.exception("Bulk export (%s) failed", fmt)
+            with self._lock:
+                job.update(status="failed", error=str(e))
+            return
+
+        with self._lock:
+            job.update(status="ready", data=data, seconds=time.perf_counter() - start)
+
+
+@st.cache_resource
+def get_bulk_exporter():
+    """One exporter per process, so every admin shares the same built zips."""
+    return BulkExporter()
+
+
+def _serialize(df, fmt):
+    if fmt == "parquet":
+        # Mixed "N/A" defaults and numbers: store as text so every column has one type
+        return df.astype(str).to_parquet(index=False)
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def _add_medal(rank):
+    """Return formatted rank with medal emoji."""
+    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+    return f"{medals.get(rank, '')} {rank}".strip()
+
+
+def _safe_filename(name):
+    return re.sub(r'[\\/:*?"<>|]+', "_", str(name)).strip() or "_"
@@ -1,6 +1,15 @@
 import numpy as np
+import pandas as pd
 from config.settings import TOTAL_LESSONS
+from data.mongo import load_student_tables
+from data.cache import stale_while_revalidate
+from data.shared_cache import shared_value
+from data.tables import dataset_version
+from telemetry.spans import timed
 
+METRIC_COLUMNS = ["total_practices", "avg_practice", "completion_rate", "consistency_score"]
+
+@timed
 def calculate_student_metrics(student):
     lessons = student.get("lessons", [])
     
@@ -12,14 +21,14 @@ def calculate_student_metrics(student):
             "consistency_score": 0
         }
     
-    total_practices = sum(int(l.get("practice_count", 0)) for l in lessons)
+    total_practices = sum(_practice_count(l) for l in lessons)
     avg_practice = total_practices / len(lessons) if lessons else 0
     completion_rate = (int(student.get("current_lesson", 0)) / TOTAL_LESSONS) * 100
     
     # Consistency score: measures regularity of practice habits
     # Higher score = more consistent practice across lessons
     # Score ranges: 70-100% (Excellent), 50-70% (Good), 0-50% (Needs improvement)
-    practice_counts = [int(l.get("practice_count", 0)) for l in lessons]
+    practice_counts = [_practice_count(l) for l in lessons]
     if len(practice_counts) > 1 and np.mean(practice_counts) > 0:
         std_dev = np.std(practice_counts)
         mean_val = np.mean(practice_counts)
@@ -34,4 +43,79 @@ def calculate_student_metrics(student):
         "avg_practice": round(avg_practice, 1),
         "completion_rate": round(completion_rate, 1),
         "consistency_score": round(consistency_score, 1)
-    }
\ No newline at end of file
+    }
+
+
+def _practice_count(lesson):
+    """Practice count as int; malformed values count as 0 (same rule as the teachers page)."""
+    try:
+        return int(lesson.get("practice_count", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+@timed
+def calculate_cohort_metrics(students, lessons):
+    """
+    calculate_student_metrics for every student at once, from the
+    (students, lessons) tables. Returns a DataFrame indexed by student_id.
+    """
+    counts = lessons["practice_count"].fillna(0).astype("float64")
+    grouped = counts.groupby(lessons["student_id"], sort=False, observed=True)
+
+    per_student = pd.DataFrame({
+        "n": grouped.size(),
+        "total": grouped.sum(),
+        "mean": grouped.mean(),
+        "std": grouped.std(ddof=0),
+        "first": counts[lessons["position"] == 0].groupby(lessons["student_id"], sort=False, observed=True).first(),
+    })
+    per_student = per_student.reindex(students["student_id"]).fillna(0)
+
+    has_lessons = per_student["n"] > 0
+    current_lesson = students.set_index("student_id")["current_lesson"].astype("float64").fillna(0)
+    completion_rate = (current_lesson / TOTAL_LESSONS * 100).where(has_lessons, 0)
+
+    # Same consistency rule as calculate_student_metrics: inverted coefficient of variation
+    spread = per_student["n"] > 1
+    mean = per_student["mean"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cv_score = ((1 - per_student["std"] / mean) * 100).clip(0, 100)
+    fallback = np.where(per_student["first"] > 0, 100.0, 0.0)
+    consistency_score = np.where(spread & (mean > 0), cv_score, fallback)
+
+    metrics = pd.DataFrame({
+        "total_practices": per_student["total"].astype("int64"),
+        "avg_practice": mean.round(1),
+        "completion_rate": completion_rate.round(1),
+        "consistency_score": np.round(consistency_score, 1),
+    }, index=per_student.index)
+    metrics.index.name = "student_id"
+
+    return metrics
+
+
+@stale_while_revalidate(ttl=60)
+def load_student_metrics():
+    """Cohort metrics table, cached alongside the loaded student tables."""
+    students, lessons = load_student_tables()
+    return shared_value("cohort_metrics", dataset_version(students), lambda: calculate_cohort_metrics(students, lessons))
+
+
+def loaded_student_metrics():
+    """The cohort metrics table if it is already loaded, else None; never starts a blocking load."""
+    if load_student_metrics.cache.age() is None:
+        return None
+    return load_student_metrics()
+
+
+def get_student_metrics(student, metrics_table=None):
+    """Read a student's metrics from the cohort table, or compute them for this student only."""
+    student_id = student.get("student_id")
+    if metrics_table is not None and student_id in metrics_table.index:
+        row = metrics_table.loc[student_id]
+        return {
+            "total_practices": int(row["total_practices"]),
+            **{col: float(row[col]) for col in METRIC_COLUMNS[1:]},
+        }
+    return calculate_student_metrics(student)
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from datetime import date
+from config.settings import (
+    TOTAL_LESSONS,
+    RISK_INACTIVE_DAYS,
+    RISK_STALL_DAYS,
+    RISK_TREND_LESSONS,
+    RISK_MIN_CONSISTENCY,
+)
+from data.mongo import load_student_tables
+from data.shared_cache import shared_value
+from data.tables import dataset_version
+from logic.metrics import calculate_cohort_metrics
+from telemetry.spans import timed
+
+RISK_REASONS = {
+    "inactive": "💤 Inactive",
+    "declining": "📉 Declining practice",
+    "stalled": "🧱 Stalled lesson",
+    "inconsistent": "🎢 Inconsistent",
+}
+
+# Points (out of 100) each signal adds to the risk score at full strength
+RISK_WEIGHTS = {"inactive": 40, "declining": 25, "stalled": 20, "inconsistent": 15}
+
+# Relative practice trend (change per lesson, as a share of the mean) counted as declining,
+# and the trend at which the declining signal is at full strength
+DECLINE_THRESHOLD = -0.1
+DECLINE_FULL = -0.3
+
+
+@timed
+def calculate_risk(students, lessons, today):
+    """
+    Risk signals for every student at once, from the (students, lessons) tables:
+
+    - inactive: days since the last practice (not counted once the course is completed)
+    - declining: least-squares slope of practice counts over the last RISK_TREND_LESSONS lessons
+    - stalled: days since the first practice of the student's latest lesson
+    - inconsistent: consistency score below RISK_MIN_CONSISTENCY
+
+    Returns a DataFrame indexed by student_id, highest risk_score first.
+    """
+    today = pd.Timestamp(today).normalize()
+    ids = students["student_id"]
+    lessons = lessons.assign(
+        lesson=lessons["lesson"].fillna(0),
+        practice_count=lessons["practice_count"].fillna(0).astype("float64"),
+    )
+    by_student = lessons.groupby("student_id", sort=False, observed=True)
+
+    # Latest lesson = first lesson with the highest lesson number (same rule as the teachers page)
+    latest = (
+        lessons.loc[by_student["lesson"].idxmax(), ["student_id", "teacher", "first_practice_at"]]
+        .set_index("student_id")
+        .reindex(ids)
+    )
+
+    info = students.set_index("student_id")
+    completed = (info["current_lesson"].fillna(0) >= TOTAL_LESSONS).astype(bool)
+    days_inactive = (today - info["last_practice_at"].dt.normalize()).dt.days.astype("float64")
+    days_on_lesson = (today - latest["first_practice_at"].dt.normalize()).dt.days.astype("float64")
+
+    trend = _practice_trend(lessons).reindex(ids)
+    metrics = calculate_cohort_metrics(students, lessons)
+    lesson_count = by_student.size().reindex(ids, fill_value=0)
+    consistency = metrics["consistency_score"].where(lesson_count > 1)
+
+    risk = pd.DataFrame({
+        "name": info["name"],
+        "phone_number": info["phone_number"],
+        "teacher": latest["teacher"],
+        "current_lesson": info["current_lesson"],
+        "days_inactive": days_inactive.astype("Int32"),
+        "days_on_lesson": days_on_lesson.astype("Int32"),
+        "trend": (trend * 100).round(1),
+        "consistency_score": consistency,
+        "inactive": (days_inactive >= RISK_INACTIVE_DAYS) & ~completed,
+        "declining": trend <= DECLINE_THRESHOLD,
+        "stalled": (days_on_lesson >= RISK_STALL_DAYS) & ~completed,
+        "inconsistent": consistency < RISK_MIN_CONSISTENCY,
+    })
+
+    # Signal strength in [0, 1]; missing inputs contribute nothing
+    strength = {
+        "inactive": (days_inactive / (2 * RISK_INACTIVE_DAYS)).where(~completed),
+        "declining": trend / DECLINE_FULL,
+        "stalled": (days_on_lesson / (2 * RISK_STALL_DAYS)).where(~completed),
+        "inconsistent": 1 - consistency / 100,
+    }
+    score = sum(RISK_WEIGHTS[flag] * strength[flag].clip(0, 1).fillna(0) for flag in RISK_WEIGHTS)
+
+    risk["needs_attention"] = risk[list(RISK_REASONS)].any(axis=1)
+    risk["risk_score"] = score.round(1)
+    risk["reasons"] = _reasons(risk)
+
+    return risk.sort_values(["risk_score", "days_inactive"], ascending=False)
+
+
+def _practice_trend(lessons):
+    """
+    Per student: slope of practice_count over the last RISK_TREND_LESSONS lessons,
+    divided by their mean (-0.2 = 20% fewer practices per lesson). NaN when
+    there are fewer than 3 lessons or no practices to compare.
+    """
+    position = lessons["position"].astype("float64")
+    last = position.groupby(lessons["student_id"], sort=False, observed=True).transform("max")
+    window = lessons[position > last - RISK_TREND_LESSONS]
+
+    x = window["position"].astype("float64")
+    y = window["practice_count"]
+    sums = pd.DataFrame({"n": 1.0, "x": x, "y": y, "xy": x * y, "xx": x * x}).groupby(
+        window["student_id"], sort=False, observed=True
+    ).sum()
+
+    n = sums["n"]
+    mean_y = sums["y"] / n
+    var_x = sums["xx"] - sums["x"] ** 2 / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (sums["xy"] - sums["x"] * sums["y"] / n) / var_x
+        relative = slope / mean_y
+    return relative.where((n >= 3) & (var_x > 0) & (mean_y > 0))
+
+
+def _reasons(risk):
+    reasons = pd.Series("", index=risk.index)
+    for flag, label in RISK_REASONS.items():
+        reasons = reasons + np.where(risk[flag], label + " · ", "")
+    return reasons.str.removesuffix(" · ")
+
+
+@timed
+def risk_by_teacher(risk):
+    """Per-teacher breakdown: students, flagged students per signal, share needing attention, average score."""
+    teacher = risk["teacher"].astype(object).fillna("Unassigned")
+    grouped = risk.groupby(teacher, sort=False)
+
+    table = grouped[[*RISK_REASONS, "needs_attention"]].sum().astype("int64")
+    table.insert(0, "students", grouped.size())
+    table["attention_rate"] = (table["needs_attention"] / table["students"] * 100).round(1)
+    table["avg_risk_score"] = grouped["risk_score"].mean().round(1)
+    table.index.name = "teacher"
+
+    return table.sort_values(["needs_attention", "avg_risk_score"], ascending=False)
+
+
+@st.cache_resource(max_entries=2)
+def _build_risk_tables(version, day, _students, _lessons):
+    def compute():
+        risk = calculate_risk(_students, _lessons, day)
+        return risk, risk_by_teacher(risk)
+    return shared_value("risk", f"{version}/{day}", compute)
+
+
+def load_risk_tables():
+    """
+    (risk, by_teacher) for the loaded dataset, rebuilt only when its version
+    changes, or the next day (days since last practice move on without new data).
+    """
+    students, lessons = load_student_tables()
+    return _build_risk_tables(dataset_version(students), date.today().isoformat(), students, lessons)
@@ -0,0 +1,159 @@
+import bisect
+import re
+import unicodedata
+
+import streamlit as st
+
+from collections import defaultdict
+from difflib import SequenceMatcher
+from data.tables import dataset_version
+
+# Hebrew final letters fold to their regular form so partial words still match
+_HEBREW_FINALS = str.maketrans({"ך": "כ", "ם": "מ", "ן": "נ", "ף": "פ", "ץ": "צ"})
+_NON_DIGITS = re.compile(r"\D")
+
+# Match ranks: lower is better
+_EXACT, _PREFIX, _WORD_PREFIX, _SUBSTRING, _PHONE, _FUZZY = range(6)
+
+
+def normalize(text):
+    """Case-fold, strip niqqud / accents and fold Hebrew final letters."""
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.casefold().translate(_HEBREW_FINALS)
+    return " ".join(text.split())
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class StudentSearchIndex:
+    """
+    Search over student names (and optionally phone numbers), built once per
+    dataset version. Substring lookup uses a trigram index; word prefixes use
+    a sorted token list; typos fall back to the names sharing a trigram with the
+    query, ranked by similarity to the full name or its closest word.
+    """
+
+    def __init__(self, student_ids, names, phones=None, fuzzy_threshold=0.7):
+        self.fuzzy_threshold = fuzzy_threshold
+        self._ids = list(student_ids)
+        self._names = [normalize(name) for name in names]
+        self._phones = [_NON_DIGITS.sub("", str(phone)) for phone in phones] if phones is not None else [""] * len(self._ids)
+
+        self._by_gram = defaultdict(set)
+        self._by_token_gram = defaultdict(set)
+        self._by_phone_gram = defaultdict(set)
+        tokens = []
+
+        for position, (name, phone) in enumerate(zip(self._names, self._phones)):
+            for gram in _trigrams(name):
+                self._by_gram[gram].add(position)
+            for i in range(len(phone) - 2):
+                self._by_phone_gram[phone[i:i + 3]].add(position)
+            for token in name.split():
+                tokens.append((token, position))
+                for gram in _trigrams(token):
+                    self._by_token_gram[gram].add(position)
+
+        tokens.sort()
+        self._tokens = tokens
+        self._token_keys = [token for token, _ in tokens]
+
+    def search(self, query, limit=None, match_phone=True, fuzzy=True):
+        """Return matching student ids, best matches first."""
+        query = normalize(query)
+        if not query:
+            return list(self._ids)
+
+        ranks = {}
+
+        def add(positions, rank):
+            for position in positions:
+                if position not in ranks or rank < ranks[position]:
+                    ranks[position] = rank
+
+        add(self._substring_matches(query), _SUBSTRING)
+        add(self._word_prefix_matches(query), _WORD_PREFIX)
+        for position in [p for p in ranks if self._names[p].startswith(query)]:
+            ranks[position] = _EXACT if self._names[position] == query else _PREFIX
+
+        digits = _NON_DIGITS.sub("", query)
+        looks_like_phone = not any(ch.isalpha() for ch in query)
+        if match_phone and looks_like_phone and len(digits) >= 3:
+            add(self._phone_matches(digits), _PHONE)
+
+        scores = {}
+        if fuzzy and (limit is None or len(ranks) < limit):
+            scores = self._fuzzy_matches(query, exclude=ranks)
+            add(scores, _FUZZY)
+
+        ordered = sorted(ranks, key=lambda p: (ranks[p], -scores.get(p, 0), self._names[p]))
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [self._ids[position] for position in ordered]
+
+    # --- Lookups ---
+    def _substring_matches(self, query):
+        if len(query) < 3:
+            return [p for p, name in enumerate(self._names) if query in name]
+
+        grams = [g for g in _trigrams(query) if not g.startswith(" ") and not g.endswith(" ")] or [query[:3]]
+        candidates = set.intersection(*(self._by_gram.get(g, set()) for g in grams))
+        return [p for p in candidates if query in self._names[p]]
+
+    def _word_prefix_matches(self, query):
+        matches = []
+        for i in range(bisect.bisect_left(self._token_keys, query), len(self._tokens)):
+            token, position = self._tokens[i]
+            if not token.startswith(query):
+                break
+            matches.append(position)
+        return matches
+
+    def _phone_matches(self, digits):
+        grams = [digits[i:i + 3] for i in range(len(digits) - 2)]
+        candidates = set.intersection(*(self._by_phone_gram.get(g, set()) for g in grams))
+        return [p for p in candidates if digits in self._phones[p]]
+
+    def _fuzzy_matches(self, query, exclude):
+        """
+        Positions whose similarity to the query passes the threshold. A name
+        scores its best of the whole name and each of its words, so a typo in
+        one word ("levy" for "Dana Levi") is not diluted by the other words.
+        """
+        if len(query) < 3:
+            return {}
+
+        candidates = set()
+        for gram in _trigrams(query):
+            candidates |= self._by_gram.get(gram, set())
+        for token in query.split():
+            for gram in _trigrams(token):
+                candidates |= self._by_token_gram.get(gram, set())
+
+        scores = {}
+        for position in candidates - exclude.keys():
+            name = self._names[position]
+            score = max(_similarity(query, text) for text in (name, *name.split()))
+            if score >= self.fuzzy_threshold:
+                scores[position] = score
+        return scores
+
+
+def _similarity(a, b):
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+@st.cache_resource(max_entries=2)
+def _build_search_index(version, _df):
+    if _df.empty:
+        return StudentSearchIndex([], [])
+    phones = _df["phone_number"] if "phone_number" in _df.columns else None
+    return StudentSearchIndex(_df["student_id"], _df["name"], phones)
+
+
+def get_search_index(df):
+    """Search index for this dataset, rebuilt only when its version changes."""
+    return _build_search_index(dataset_version(df), df)
@@ -0,0 +1,43 @@
+import streamlit as st
+
+from collections import Counter
+from data.tables import dataset_version
+
+
+class StudentIndex:
+    """
+    Roster ids and their display labels for the sidebar selectbox.
+    Students sharing a name are told apart by phone number.
+    """
+
+    def __init__(self, df):
+        self._ids = []
+        self._labels = {}
+
+        if df.empty:
+            return
+
+        self._ids = list(df["student_id"])
+        name_counts = Counter(df["name"])
+        phones = df["phone_number"] if "phone_number" in df.columns else df["student_id"]
+        for student_id, name, phone in zip(df["student_id"], df["name"], phones):
+            self._labels[student_id] = f"{name} ({phone})" if name_counts[name] > 1 else name
+
+    @property
+    def ids(self):
+        """All student ids, in roster order."""
+        return list(self._ids)
+
+    def label(self, student_id):
+        """Display name for the sidebar selectbox."""
+        return self._labels.get(student_id, "Unknown")
+
+
+@st.cache_resource(max_entries=2)
+def _build_student_index(version, _df):
+    return StudentIndex(_df)
+
+
+def get_student_index(df):
+    """Student index for this dataset, rebuilt only when its version changes."""
+    return _build_student_index(dataset_version(df), df)
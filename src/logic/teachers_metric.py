@@ -1,6 +1,13 @@
 import streamlit as st
 
 from collections import defaultdict
+from config.settings import DATA_SOURCE, TEACHER_STATS_MODE
+from data.mongo import load_student_tables, load_teacher_summary
+from data.cache import stale_while_revalidate
+from data.aggregations import TeacherSummary
+from data.shared_cache import shared_value
+from data.tables import dataset_version
+from telemetry.spans import timed
 
 def get_active_teacher(student):
     """Get the teacher of the most recent lesson for a student."""
@@ -61,6 +68,77 @@ def categorize_students_by_teacher(df):
     
     return teacher_data
 
+
+@timed
+def categorize_students_by_teacher_columnar(students, lessons):
+    """
+    Columnar version of categorize_students_by_teacher over the typed
+    (students, lessons) tables from load_student_tables.
+    Returns the same structure: teacher -> {"current", "past", "total_practices"}.
+    """
+    teacher_data = defaultdict(lambda: {"current": [], "past": [], "total_practices": 0})
+    if lessons.empty:
+        return teacher_data
+
+    lessons = lessons.assign(
+        lesson=lessons["lesson"].fillna(0),
+        practice_count=lessons["practice_count"].fillna(0),
+    )
+
+    # Active teacher = teacher of the first lesson with the highest lesson number
+    active_rows = lessons.groupby("student_id", sort=False, observed=True)["lesson"].idxmax()
+    active = lessons.loc[active_rows, ["student_id", "teacher"]].rename(columns={"teacher": "active_teacher"})
+
+    taught = lessons[lessons["teacher"].notna() & (lessons["teacher"] != "")]
+    totals = taught.groupby("teacher", sort=False, observed=True)["practice_count"].sum()
+
+    # One row per (student, teacher) pair, in roster order
+    info = students[["student_id", "name", "current_lesson", "phone_number", "last_practice_timedate"]]
+    pairs = (
+        taught[["student_id", "teacher"]]
+        .drop_duplicates()
+        .merge(active, on="student_id", how="left")
+        .merge(info, on="student_id", how="left")
+    )
+    pairs["is_current"] = (pairs["teacher"] == pairs["active_teacher"]).fillna(False)
+    pairs = pairs.rename(columns={"phone_number": "phone", "last_practice_timedate": "last_practice"})
+
+    defaults = {"name": "Unknown", "current_lesson": "N/A", "phone": "N/A", "last_practice": "N/A"}
+    info_cols = list(defaults)
+    for col, default in defaults.items():
+        pairs[col] = pairs[col].astype(object).where(pairs[col].notna(), default)
+
+    for teacher, total in totals.items():
+        teacher_data[teacher]["total_practices"] = int(total)
+
+    for (teacher, is_current), group in pairs.groupby(["teacher", "is_current"], sort=False, observed=True):
+        key = "current" if is_current else "past"
+        teacher_data[teacher][key] = group[info_cols].to_dict("records")
+
+    return teacher_data
+
+
+def load_teacher_data():
+    """
+    Teacher summary from the configured TEACHER_STATS_MODE ("server" or "python").
+    The server aggregation needs MongoDB, so other data sources always use "python".
+    """
+    if TEACHER_STATS_MODE == "server" and DATA_SOURCE == "mongo":
+        return load_teacher_summary()
+    return _load_teacher_data_python()
+
+
+@stale_while_revalidate(ttl=60)
+def _load_teacher_data_python():
+    # Cached next to the student tables so reruns never recategorize
+    students, lessons = load_student_tables()
+    version = dataset_version(students)
+    return shared_value(
+        "teacher_summary", version,
+        lambda: TeacherSummary(categorize_students_by_teacher_columnar(students, lessons), version=version),
+    )
+
+
 #SUMMARY METRICS
 def _render_summary_metrics(teacher_data):
     """Show overall summary metrics for all teachers."""
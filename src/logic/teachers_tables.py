@@ -1,6 +1,7 @@
 import streamlit as st
-import pandas as pd
+from functools import partial
 
+from logic.exports import student_table, teacher_roster_csv
 from ui.teachers_leadboards import _render_teacher_stats
 
 # TEACHER SELECTOR
@@ -25,14 +26,14 @@ def _render_teacher_details(selected_teacher, teacher_data):
 
     with tab_current:
         _render_student_table(
-            current_students,
+            teacher_data,
             selected_teacher,
             is_current=True
         )
 
     with tab_past:
         _render_student_table(
-            past_students,
+            teacher_data,
             selected_teacher,
             is_current=False
         )
@@ -40,27 +41,24 @@ def _render_teacher_details(selected_teacher, teacher_data):
     _render_teacher_stats(selected_teacher, teacher_data)
 
 
-def _render_student_table(student_list, teacher, is_current):
-    """Display a student list inside a tab."""
+def _render_student_table(teacher_data, teacher, is_current):
+    """Display a teacher's current or past students inside a tab."""
+    kind = "current" if is_current else "past"
+    student_list = teacher_data[teacher][kind]
     if not student_list:
         st.info("No students found.")
         return
 
-    df = pd.DataFrame(student_list).rename(columns={
-        "name": "Student Name",
-        "current_lesson": "Current Lesson",
-        "phone": "Phone Number",
-        "last_practice": "Last Practice"
-    })
+    df = student_table(student_list)
 
     st.dataframe(df, use_container_width=True, hide_index=True)
 
-    csv = df.to_csv(index=False).encode("utf-8")
-    filename = f"{teacher}_{'current' if is_current else 'past'}_students.csv"
+    filename = f"{teacher}_{kind}_students.csv"
 
+    # Serialized only when clicked, then cached for this dataset version
     st.download_button(
         label="📥 Download CSV",
-        data=csv,
+        data=partial(teacher_roster_csv, teacher_data.version, teacher, kind, teacher_data),
         file_name=filename,
         mime="text/csv"
     )
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Production entry point: runs the dashboard with a warm-up and a readiness endpoint.
+
+    python serve.py --server.port=8501 --server.address=0.0.0.0
+
+Arguments are passed on to `streamlit run app.py`. The warm-up runs in the same
+process as Streamlit (so it fills the caches the sessions read from), and
+GET :READINESS_PORT/ready answers 503 until it has finished, then 200.
+"""
+import os
+import sys
+
+from streamlit.web import cli as stcli
+
+from config.settings import READINESS_PORT, WARMUP_STUDENTS
+from warmup import start_readiness_server, start_warmup
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def main():
+    start_readiness_server(READINESS_PORT)
+    start_warmup(WARMUP_STUDENTS)
+
+    sys.argv = ["streamlit", "run", APP, *sys.argv[1:]]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
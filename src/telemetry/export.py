@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from telemetry.spans import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+_exporter_lock = threading.Lock()
+_exporter_started = False
+
+
+def to_json(snapshot=None):
+    """One structured log record of every span histogram."""
+    return json.dumps({
+        "event": "span_histograms",
+        "timestamp": time.time(),
+        "pid": os.getpid(),
+        "spans": REGISTRY.snapshot() if snapshot is None else snapshot,
+    })
+
+
+def to_prometheus(snapshot=None):
+    """Span histograms in the Prometheus text exposition format."""
+    snapshot = REGISTRY.snapshot() if snapshot is None else snapshot
+    lines = [
+        "# HELP dashboard_span_duration_ms Duration of instrumented dashboard sections in milliseconds.",
+        "# TYPE dashboard_span_duration_ms histogram",
+    ]
+    for name, hist in snapshot.items():
+        label = _escape(name)
+        cumulative = 0
+        for bound, n in hist["buckets"].items():
+            cumulative += n
+            lines.append(f'dashboard_span_duration_ms_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'dashboard_span_duration_ms_sum{{span="{label}"}} {hist["sum_ms"]}')
+        lines.append(f'dashboard_span_duration_ms_count{{span="{label}"}} {hist["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_file(path):
+    """Write the textfile atomically, so a scraper never reads a partial file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(to_prometheus())
+    os.replace(tmp, path)
+
+
+def export_once(mode, path=None):
+    if mode == "json":
+        logger.info(to_json())
+    elif mode == "prometheus":
+        write_prometheus_file(path)
+
+
+def start_exporter(mode, path, interval):
+    """
+    Start the background exporter once per process. `mode` is "json"
+    (structured log line), "prometheus" (textfile at `path`) or "off".
+    """
+    global _exporter_started
+    if mode not in ("json", "prometheus"):
+        return
+    with _exporter_lock:
+        if _exporter_started:
+            return
+        _exporter_started = True
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                export_once(mode, path)
+            except Exception:
+                logger.exception("Exporting span histograms failed")
+
+    threading.Thread(target=loop, name="telemetry-exporter", daemon=True).start()
+
+
+def _escape(value):
+    return re.sub(r'(["\\])', r"\\\1", value).replace("\n", "\\n")
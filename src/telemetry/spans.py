@@ -0,0 +1,141 @@
+import functools
+import threading
+import time
+
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in milliseconds (Prometheus-style, cumulative on export)
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Spans kept per rerun; fragment reruns append to the last full run's list
+MAX_RUN_SPANS = 500
+
+_local = threading.local()
+
+
+class Histogram:
+    """Count, sum, max and bucket counts of span durations for one span name."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)  # last bucket is +Inf
+
+    def observe(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile(self, q):
+        """Upper bucket bound holding the q-th quantile (max for the +Inf bucket)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if seen >= target:
+                return round(min(bound, self.max_ms), 3)
+        return round(self.max_ms, 3)
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": dict(zip([*map(str, BUCKETS_MS), "+Inf"], self.buckets)),
+        }
+
+
+class Registry:
+    """Process-wide histograms of every span, shared by all sessions."""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, ms):
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = Histogram()
+            hist.observe(ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: hist.as_dict() for name, hist in sorted(self._histograms.items())}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+REGISTRY = Registry()
+
+
+# --- Per-rerun recording ---
+def start_run():
+    """Start recording spans for this script run (call at the top of the app script)."""
+    _local.run_started = time.perf_counter()
+    _local.spans = []
+    _local.depth = 0
+
+
+def run_spans():
+    """Spans recorded on this thread since start_run(): dicts of name, depth, start_ms, ms."""
+    return list(getattr(_local, "spans", []))
+
+
+def run_elapsed_ms():
+    """Milliseconds since start_run() on this thread (None if no run was started)."""
+    started = getattr(_local, "run_started", None)
+    if started is None:
+        return None
+    return (time.perf_counter() - started) * 1000
+
+
+@contextmanager
+def span(name):
+    """
+    Time a block. Always feeds the process-wide histogram; also recorded in
+    the current rerun when the calling thread has started one.
+    """
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _local.depth = depth
+        ms = (end - start) * 1000
+        REGISTRY.observe(name, ms)
+
+        spans = getattr(_local, "spans", None)
+        if spans is not None and len(spans) < MAX_RUN_SPANS:
+            spans.append({
+                "name": name,
+                "depth": depth,
+                "start_ms": (start - _local.run_started) * 1000,
+                "ms": ms,
+            })
+
+
+def timed(fn):
+    """Decorator: record every call of `fn` as a span named `module.function`."""
+    name = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return fn(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,112 @@
+import hashlib
+import io
+import json
+import threading
+
+from collections import OrderedDict
+
+import streamlit as st
+
+from config.settings import CHART_CACHE_MAX_MB
+from data.shared_cache import get_shared_cache
+
+
+class ChartCache:
+    """Process-wide LRU of rendered chart bytes, bounded by total size."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+            self._entries[key] = data
+            self.size += len(data)
+
+            # Evict least recently used charts until we fit the cap again
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@st.cache_resource
+def get_chart_cache():
+    return ChartCache(CHART_CACHE_MAX_MB * 1024 * 1024)
+
+
+def chart_key(chart_type, payload, theme="dark"):
+    """Stable hash of the chart inputs, chart type and theme."""
+    raw = json.dumps([chart_type, theme, payload], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def figure_to_png(fig):
+    """Rasterize a matplotlib figure and close it right away so it is not retained by pyplot."""
+    from matplotlib import pyplot as plt
+
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight")
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def cached_chart_png(chart_type, render_fn, *args, theme="dark"):
+    """
+    PNG bytes for render_fn(*args), served from the chart cache (or the shared
+    cache of this node) when the same inputs were rendered before.
+    Returns None when render_fn has nothing to draw.
+    """
+    cache = get_chart_cache()
+    key = chart_key(chart_type, args, theme)
+
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    # Rendered by another replica on this node?
+    shared = get_shared_cache()
+    data = shared.get(f"chart/{key}")
+    if data is None:
+        fig = render_fn(*args)
+        if fig is None:
+            return None
+        data = figure_to_png(fig)
+        shared.put(f"chart/{key}", data)
+
+    cache.put(key, data)
+    return data
@@ -2,6 +2,8 @@ from matplotlib import pyplot as plt
 import numpy as np
 import pandas as pd
 
+from logic.metrics import _practice_count
+
 
 def render_progress_ring(current: int, total: int = 18):
     """Modern circular progress indicator"""
@@ -36,9 +38,9 @@ def render_practice_heatmap(lessons):
     ax.set_facecolor('none')
     
     lesson_nums = [int(l.get("lesson", 0)) for l in lessons]
-    practice_counts = [int(l.get("practice_count", 0)) for l in lessons]
+    practice_counts = [_practice_count(l) for l in lessons]
     
-    colors = plt.cm.plasma(np.array(practice_counts) / max(practice_counts) if practice_counts else [1])
+    colors = plt.cm.plasma(np.array(practice_counts) / max(max(practice_counts), 1))
     
     ax.bar(lesson_nums, practice_counts, color=colors, edgecolor='white', linewidth=1)
     ax.set_xlabel('Lesson Number', color='white', fontsize=12)
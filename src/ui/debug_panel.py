@@ -0,0 +1,46 @@
+import pandas as pd
+import streamlit as st
+
+from config.settings import DEBUG_PANEL
+from telemetry.export import to_json, to_prometheus
+from telemetry.spans import REGISTRY, run_elapsed_ms, run_spans
+
+
+def debug_panel_enabled():
+    return DEBUG_PANEL or st.query_params.get("debug") == "1"
+
+
+def render_debug_panel():
+    """Per-rerun span timings and process-wide histograms. Call last, inside the sidebar."""
+    with st.expander("⏱️ Timings", expanded=False):
+        elapsed = run_elapsed_ms()
+        if elapsed is not None:
+            st.caption(f"This rerun: {elapsed:.0f} ms")
+
+        spans = sorted(run_spans(), key=lambda s: s["start_ms"])
+        if spans:
+            st.dataframe(
+                pd.DataFrame({
+                    "span": ["\u2003" * s["depth"] + s["name"] for s in spans],
+                    "ms": [round(s["ms"], 1) for s in spans],
+                }),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+        snapshot = REGISTRY.snapshot()
+        if snapshot:
+            st.markdown("**All sessions (this process)**")
+            st.dataframe(
+                pd.DataFrame([
+                    {"span": name, "count": h["count"], "mean ms": round(h["sum_ms"] / h["count"], 1),
+                     "p95 ms": h["p95_ms"], "max ms": h["max_ms"]}
+                    for name, h in snapshot.items()
+                ]).sort_values("mean ms", ascending=False),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+            col1, col2 = st.columns(2)
+            col1.download_button("JSON", to_json(snapshot), "spans.json", "application/json")
+            col2.download_button("Prometheus", to_prometheus(snapshot), "spans.prom", "text/plain")
@@ -1,12 +1,17 @@
+import importlib
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from config.settings import TOTAL_LESSONS
-from ui.charts import render_practice_heatmap, render_progress_ring, render_trend_chart
+from config.settings import TOTAL_LESSONS, CHART_BACKEND
+from logic.metrics import _practice_count
+from ui.chart_cache import cached_chart_png
+from telemetry.spans import span, timed
 
 
 #  TOP METRICS SECTION
+@timed
 def render_student_top_metrics(student, metrics):
     st.markdown("### 📈 Key Metrics")
     col1, col2, col3, col4 = st.columns(4)
@@ -28,6 +33,7 @@ def render_student_top_metrics(student, metrics):
 
 
 #  STUDENT PROFILE CARD
+@timed
 def render_student_profile(student):
     st.markdown("### 👤 Student Profile")
 
@@ -54,13 +60,16 @@ def render_student_profile(student):
     # RIGHT — progress ring-
     with col_right:
         st.markdown("<div style='padding: 20px;'>", unsafe_allow_html=True)
-        fig = render_progress_ring(int(student["current_lesson"]), TOTAL_LESSONS)
-        st.pyplot(fig)
+        _render_chart("progress_ring", int(student["current_lesson"]), TOTAL_LESSONS)
         st.markdown("</div>", unsafe_allow_html=True)
 
 
 
 #  PRACTICE ANALYSIS SECTION
+PRACTICE_VIEWS = ["📈 Trend Analysis", "🔥 Practice Heatmap", "📋 Lesson Details"]
+
+
+@timed
 def render_practice_analysis(student, metrics):
     st.markdown("### 📊 Practice Analysis")
 
@@ -70,14 +79,19 @@ def render_practice_analysis(student, metrics):
         st.info("📭 No lesson data available yet")
         return
 
-    tab1, tab2, tab3 = st.tabs(["📈 Trend Analysis", "🔥 Practice Heatmap", "📋 Lesson Details"])
+    # Only the selected view is built; charts and tables are cached once built
+    view = st.radio(
+        "Practice view",
+        PRACTICE_VIEWS,
+        horizontal=True,
+        key="practice_view",
+        label_visibility="collapsed",
+    )
 
 
     # Trend chart
-    with tab1:
-        fig = render_trend_chart(lessons)
-        if fig:
-            st.pyplot(fig)
+    if view == PRACTICE_VIEWS[0]:
+        _render_chart("trend", lessons)
 
         col1, col2 = st.columns(2)
 
@@ -89,17 +103,15 @@ def render_practice_analysis(student, metrics):
 
         with col2:
             recent = lessons[-3:] if len(lessons) >= 3 else lessons
-            recent_avg = np.mean([int(l.get("practice_count", 0)) for l in recent])
+            recent_avg = np.mean([_practice_count(l) for l in recent])
             _info_box("📅 Recent Performance", f"{recent_avg:.1f} avg practices (last 3 lessons)")
 
 
     # Heatmap
-    with tab2:
-        fig = render_practice_heatmap(lessons)
-        if fig:
-            st.pyplot(fig)
+    elif view == PRACTICE_VIEWS[1]:
+        _render_chart("heatmap", lessons)
 
-        practice_counts = [int(l.get("practice_count", 0)) for l in lessons]
+        practice_counts = [_practice_count(l) for l in lessons]
         _info_box(
             "📊 Practice Distribution",
             f"Min: {min(practice_counts)} | Max: {max(practice_counts)} | Median: {np.median(practice_counts):.0f}"
@@ -107,29 +119,97 @@ def render_practice_analysis(student, metrics):
 
 
     # Lesson Details Table
-    with tab3:
-        df = pd.DataFrame(lessons)
-        df = df.sort_values("lesson", ascending=False)
-        st.dataframe(df, use_container_width=True, height=400, hide_index=True)
+    else:
+        st.dataframe(_lessons_table(lessons), use_container_width=True, height=400, hide_index=True)
 
 
 
 #  ALL STUDENTS TABLE
-def render_all_students_overview(df):
+@timed
+def render_all_students_overview(df, load_metrics=None):
     with st.expander("📋 All Students Overview", expanded=False):
-        summary = df.copy()
-        summary["current_lesson"] = summary["current_lesson"].astype(int)
+        summary = df
+        columns = ["name", "phone_number", "current_lesson", "total_messages", "last_practice_at"]
+
+        # Cohort metrics need every student's lessons, so they load only on request
+        metrics = None
+        if load_metrics is not None and st.toggle("Include practice metrics"):
+            metrics = load_metrics()
+
+        if metrics is not None and "student_id" in summary.columns:
+            summary = summary.join(metrics, on="student_id")
+            columns += ["total_practices", "avg_practice", "consistency_score"]
+
         summary = summary.sort_values("current_lesson", ascending=False)
 
         st.dataframe(
-            summary[["name", "phone_number", "current_lesson", "total_messages", "last_practice_timedate"]],
+            summary[columns],
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={
+                "last_practice_at": st.column_config.DateColumn("last_practice_timedate", format="ddd, DD.MM.YYYY"),
+            }
         )
 
 
 
 #  INTERNAL HELPERS
+# Chart modules pull in matplotlib / altair, so they are imported on first draw, not at startup
+_CHART_MODULES = {"matplotlib": "ui.charts", "vega": "ui.vega_charts"}
+
+_CHART_RENDERERS = {
+    "progress_ring": "render_progress_ring",
+    "trend": "render_trend_chart",
+    "heatmap": "render_practice_heatmap",
+}
+
+
+def _chart_renderer(chart_type):
+    module = importlib.import_module(_CHART_MODULES[CHART_BACKEND])
+    return getattr(module, _CHART_RENDERERS[chart_type])
+
+
+@st.cache_data(max_entries=64)
+def _lessons_table(lessons):
+    df = pd.DataFrame(lessons)
+    return df.sort_values("lesson", ascending=False)
+
+
+def _render_chart(chart_type, *args):
+    """Draw a chart with the configured CHART_BACKEND."""
+    render_fn = _chart_renderer(chart_type)
+
+    with span(f"ui.chart.{chart_type}"):
+        if CHART_BACKEND == "vega":
+            chart = render_fn(*args)
+            if chart is not None:
+                st.altair_chart(chart, width="stretch", theme=None)
+            return
+
+        png = cached_chart_png(chart_type, render_fn, *args)
+        if png:
+            st.image(png, width="stretch")
+
+
+def prerender_student_charts(student):
+    """
+    Render a student's profile and analysis charts into the shared chart cache
+    without drawing anything (used by the warm-up). Vega charts are drawn by the
+    browser, so for that backend only the chart module is imported.
+    """
+    if CHART_BACKEND != "matplotlib":
+        _chart_renderer("trend")
+        return
+
+    charts = [("progress_ring", int(student["current_lesson"]), TOTAL_LESSONS)]
+    lessons = student.get("lessons", [])
+    if lessons:
+        charts += [("trend", lessons), ("heatmap", lessons)]
+
+    for chart_type, *args in charts:
+        cached_chart_png(chart_type, _chart_renderer(chart_type), *args)
+
+
 def _metric_card(label, value):
     st.markdown(f"""
     <div class="metric-card">
@@ -144,24 +224,19 @@ def _calculate_course_duration(student):
     if not lessons:
         return "No data"
 
-    first_practice = lessons[0].get("first_practice")
-    if not first_practice or not isinstance(first_practice, str) or "," not in first_practice:
+    # Parsed once at ingest (see data/dates.py)
+    first_date = student.get("first_practice_at")
+    if pd.isna(first_date):
         return "Unknown"
 
-    try:
-        date_part = first_practice.split(",")[1].strip()
-        first_date = datetime.strptime(date_part, "%d.%m.%Y")
-        days = (datetime.now() - first_date).days
+    days = (datetime.now() - first_date).days
 
-        months = days // 30
-        remainder = days % 30
+    months = days // 30
+    remainder = days % 30
 
-        if months > 0:
-            return f"{months} months, {remainder} days"
-        return f"{days} days"
-
-    except:
-        return "Unknown"
+    if months > 0:
+        return f"{months} months, {remainder} days"
+    return f"{days} days"
 
 
 
@@ -174,24 +249,16 @@ def _render_profile_badges(student):
     teacher = lessons[-1].get("teacher", "Unknown")
 
     # Days since last practice
-    last_practice = student.get("last_practice_timedate", "")
-    
-    # Check if last_practice is a valid string before checking for comma
-    if isinstance(last_practice, str) and "," in last_practice:
-        try:
-            date_part = last_practice.split(",")[1].strip()
-            last_date = datetime.strptime(date_part, "%d.%m.%Y")
-            days = (datetime.now() - last_date).days
-            recency = f"🕐 {days} days ago" if days > 0 else "🕐 Today"
-        except:
-            recency = "🕐 Unknown"
-    else:
+    last_date = student.get("last_practice_at")
+    if pd.isna(last_date):
         recency = "🕐 Unknown"
+    else:
+        days = (datetime.now() - last_date).days
+        recency = f"🕐 {days} days ago" if days > 0 else "🕐 Today"
 
     # Hardest lesson
-    hardest_idx = max(range(len(lessons)), key=lambda i: int(lessons[i].get("practice_count", 0)))
-    hardest = lessons[hardest_idx]
-    hardest_text = f"⚠️ Hardest: L{hardest['lesson']} ({hardest['practice_count']} practices)"
+    hardest = max(lessons, key=_practice_count)
+    hardest_text = f"⚠️ Hardest: L{hardest.get('lesson')} ({_practice_count(hardest)} practices)"
 
     # Render 3 badges
     cols = st.columns(3)
@@ -0,0 +1,86 @@
+import streamlit as st
+from logic.risk import RISK_REASONS
+from telemetry.spans import timed
+
+ALL_TEACHERS = "All teachers"
+
+RISK_COLUMNS = {
+    "name": st.column_config.TextColumn("Student Name"),
+    "teacher": st.column_config.TextColumn("Teacher"),
+    "current_lesson": st.column_config.NumberColumn("Current Lesson"),
+    "risk_score": st.column_config.ProgressColumn("Risk", min_value=0, max_value=100, format="%.0f"),
+    "reasons": st.column_config.TextColumn("Why"),
+    "days_inactive": st.column_config.NumberColumn("Days Inactive"),
+    "days_on_lesson": st.column_config.NumberColumn("Days on Lesson"),
+    "trend": st.column_config.NumberColumn("Trend / Lesson", format="%.1f%%"),
+    "consistency_score": st.column_config.NumberColumn("Consistency", format="%.1f%%"),
+    "phone_number": st.column_config.TextColumn("Phone Number"),
+}
+
+TEACHER_COLUMNS = {
+    "teacher": st.column_config.TextColumn("Teacher"),
+    "students": st.column_config.NumberColumn("Current Students"),
+    "needs_attention": st.column_config.NumberColumn("Needs Attention"),
+    "attention_rate": st.column_config.ProgressColumn("Share", min_value=0, max_value=100, format="%.1f%%"),
+    "avg_risk_score": st.column_config.NumberColumn("Avg Risk", format="%.1f"),
+    **{flag: st.column_config.NumberColumn(label) for flag, label in RISK_REASONS.items()},
+}
+
+
+# SUMMARY METRICS
+def _render_risk_summary(risk):
+    """Counts of students needing attention, overall and per signal."""
+    flagged = int(risk["needs_attention"].sum())
+
+    cols = st.columns(len(RISK_REASONS) + 1)
+    cols[0].metric("Needs Attention", flagged, f"{flagged / len(risk) * 100:.0f}% of students", delta_color="off")
+    for col, (flag, label) in zip(cols[1:], RISK_REASONS.items()):
+        col.metric(label, int(risk[flag].sum()))
+
+
+# ATTENTION LIST
+@timed
+def _render_attention_list(risk):
+    """Students ranked by risk score, filterable by teacher and reason; columns sort on click."""
+    col1, col2, col3 = st.columns([2, 3, 1])
+
+    teachers = sorted(risk["teacher"].dropna().unique())
+    teacher = col1.selectbox("Teacher", [ALL_TEACHERS, *teachers], key="risk_teacher")
+    reasons = col2.multiselect(
+        "Reasons",
+        list(RISK_REASONS),
+        format_func=RISK_REASONS.get,
+        placeholder="Any reason",
+        key="risk_reasons",
+    )
+    show_all = col3.toggle("All students", key="risk_show_all")
+
+    rows = risk if show_all else risk[risk["needs_attention"]]
+    if teacher != ALL_TEACHERS:
+        rows = rows[rows["teacher"] == teacher]
+    if reasons:
+        rows = rows[rows[reasons].any(axis=1)]
+
+    if rows.empty:
+        st.info("🎉 No students match these filters.")
+        return
+
+    st.caption(f"{len(rows)} students")
+    st.dataframe(
+        rows[list(RISK_COLUMNS)],
+        column_config=RISK_COLUMNS,
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# PER-TEACHER BREAKDOWN
+@timed
+def _render_teacher_breakdown(by_teacher):
+    """Students needing attention per (active) teacher."""
+    st.dataframe(
+        by_teacher.reset_index()[list(TEACHER_COLUMNS)],
+        column_config=TEACHER_COLUMNS,
+        use_container_width=True,
+        hide_index=True,
+    )
@@ -1,5 +1,7 @@
 import streamlit as st
-import pandas as pd
+from functools import partial
+from logic.exports import EXPORT_FORMATS, get_bulk_exporter, leaderboard_csv, leaderboard_table
+from telemetry.spans import timed
 
 # TEACHER STATISTICS BOXES
 def _render_teacher_stats(teacher, teacher_data):
@@ -20,26 +22,12 @@ def _render_teacher_stats(teacher, teacher_data):
 
 
 # LEADERBOARD SECTION
+@timed
 def _render_leaderboard(teacher_data):
     """Display leaderboard of teachers ranked by practices checked."""
     st.markdown("## 🏆 Teachers Leaderboard - Most Practices Checked")
 
-    leaderboard = [
-        {
-            "Teacher": teacher,
-            "Practices Checked": data["total_practices"],
-            "Current Students": len(data["current"]),
-            "Past Students": len(data["past"]),
-            "Total Students": len(data["current"]) + len(data["past"]),
-        }
-        for teacher, data in teacher_data.items()
-    ]
-
-    df = pd.DataFrame(leaderboard)
-    df = df.sort_values("Practices Checked", ascending=False)
-    df.insert(0, "Rank", range(1, len(df) + 1))
-
-    df["Rank"] = df["Rank"].apply(_add_medal)
+    df = leaderboard_table(teacher_data)
 
     st.dataframe(
         df,
@@ -47,16 +35,44 @@ def _render_leaderboard(teacher_data):
         hide_index=True
     )
 
-    csv = df.to_csv(index=False).encode("utf-8")
+    # Serialized only when clicked, then cached for this dataset version
     st.download_button(
         label="📥 Download Leaderboard CSV",
-        data=csv,
+        data=partial(leaderboard_csv, teacher_data.version, teacher_data),
         file_name="teachers_leaderboard.csv",
         mime="text/csv"
     )
 
 
-def _add_medal(rank):
-    """Return formatted rank with medal emoji."""
-    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
-    return f"{medals.get(rank, '')} {rank}".strip()
+# BULK EXPORT
+def _render_bulk_export(teacher_data):
+    """
+    One zip with every teacher's current and past students. It is built in a
+    background thread; returns True while the build is still running.
+    """
+    st.markdown("### 📦 Full Export")
+    fmt = st.radio("Format:", EXPORT_FORMATS, format_func=str.upper, horizontal=True, key="bulk_export_format")
+
+    exporter = get_bulk_exporter()
+    job = exporter.job(teacher_data.version, fmt)
+
+    if job is None or job["status"] == "failed":
+        if job is not None:
+            st.error(f"Export failed: {job['error']}")
+        if st.button("📦 Prepare export of all teachers"):
+            exporter.request(teacher_data, fmt)
+            return True
+        return False
+
+    if job["status"] == "running":
+        st.info("⏳ Preparing export...")
+        return True
+
+    st.download_button(
+        label=f"📥 Download all rosters ({fmt.upper()}, zip)",
+        data=job["data"],
+        file_name=f"teacher_rosters_{fmt}.zip",
+        mime="application/zip"
+    )
+    st.caption(f"Built in {job['seconds']:.1f}s for the current data")
+    return False
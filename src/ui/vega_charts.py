@@ -0,0 +1,109 @@
+import altair as alt
+import pandas as pd
+
+# Same palette as the matplotlib charts in ui/charts.py
+ACCENT = "#00d2ff"
+TEACHER = "#f093fb"
+TRACK = "rgba(255,255,255,0.2)"
+
+
+def _dark(chart):
+    """Transparent background with white axes, matching the matplotlib styling."""
+    return (
+        chart
+        .configure(background="transparent")
+        .configure_view(strokeWidth=0)
+        .configure_axis(
+            labelColor="white",
+            titleColor="white",
+            titleFontSize=12,
+            domainColor="white",
+            tickColor="white",
+            gridColor="white",
+            gridOpacity=0.2,
+        )
+    )
+
+
+def _lessons_frame(lessons):
+    df = pd.DataFrame(lessons)
+    df["lesson"] = pd.to_numeric(df["lesson"], errors="coerce")
+    df["practice_count"] = pd.to_numeric(df["practice_count"], errors="coerce")
+    return df.sort_values("lesson")
+
+
+def render_progress_ring(current: int, total: int = 18):
+    """Modern circular progress indicator (Vega-Lite arc)"""
+    data = pd.DataFrame({
+        "part": ["done", "left"],
+        "value": [current, total - current],
+        "order": [0, 1],
+    })
+
+    ring = alt.Chart(data).mark_arc(innerRadius=70, outerRadius=100).encode(
+        theta=alt.Theta("value:Q", stack=True),
+        order="order:O",
+        color=alt.Color("part:N", scale=alt.Scale(domain=["done", "left"], range=[ACCENT, TRACK]), legend=None),
+        tooltip=["value:Q"],
+    )
+
+    label = alt.Chart(pd.DataFrame({"x": [0]})).mark_text(
+        text=[f"{current}", f"of {total}"], fontSize=20, fontWeight="bold", color="white", lineHeight=24,
+    )
+
+    return _dark((ring + label).properties(width=220, height=220))
+
+
+def render_practice_heatmap(lessons):
+    """Practice intensity heatmap"""
+    if not lessons:
+        return None
+
+    df = _lessons_frame(lessons)
+    max_count = max(df["practice_count"].max(), 1)
+
+    chart = alt.Chart(df).mark_bar(stroke="white", strokeWidth=1).encode(
+        x=alt.X("lesson:O", title="Lesson Number", axis=alt.Axis(labelAngle=0)),
+        y=alt.Y("practice_count:Q", title="Practices", axis=alt.Axis(tickMinStep=1)),
+        color=alt.Color("practice_count:Q", scale=alt.Scale(scheme="plasma", domain=[0, max_count]), legend=None),
+        tooltip=["lesson:O", "practice_count:Q", "teacher:N"],
+    ).properties(height=160)
+
+    return _dark(chart)
+
+
+def render_trend_chart(lessons):
+    """Practice trend with area fill and teacher annotations on the x-axis"""
+    if not lessons:
+        return None
+
+    df = _lessons_frame(lessons)
+    # First name only; the browser lays out Hebrew right-to-left, so no reversing needed
+    df["teacher_short"] = df["teacher"].fillna("").astype(str).str.split().str[0].fillna("")
+    df["zero"] = 0
+
+    base = alt.Chart(df).encode(
+        x=alt.X("lesson:Q", title="Lesson Number", axis=alt.Axis(values=df["lesson"].dropna().tolist(), format="d")),
+    )
+
+    area = base.mark_area(color=ACCENT, opacity=0.3).encode(y="practice_count:Q")
+    line = base.mark_line(color=ACCENT, strokeWidth=3).encode(
+        y=alt.Y("practice_count:Q", title="Practice Count", axis=alt.Axis(tickMinStep=1)),
+    )
+    points = base.mark_point(filled=True, size=80, fill="white", stroke=ACCENT, strokeWidth=2, opacity=1).encode(
+        y="practice_count:Q",
+        tooltip=["lesson:Q", "practice_count:Q", "teacher:N"],
+    )
+    # Dark rounded box behind each label, like the bbox of the matplotlib chart. Vega-Lite
+    # cannot size a rect to its text, so every box fits the longest label
+    labels = base.transform_filter("datum.teacher_short != ''")
+    label_width = 6 * int(df["teacher_short"].str.len().max()) + 8
+    boxes = labels.mark_rect(color="black", opacity=0.6, cornerRadius=4, width=label_width, height=14).encode(
+        y="zero:Q",
+    )
+    teachers = labels.mark_text(color=TEACHER, fontSize=8, fontWeight="bold").encode(
+        y="zero:Q",
+        text="teacher_short:N",
+    )
+
+    return _dark((area + line + points + boxes + teachers).properties(height=320))
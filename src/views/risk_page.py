@@ -0,0 +1,48 @@
+import streamlit as st
+
+from ui.css import inject_css
+from telemetry.spans import span, timed
+from logic.risk import load_risk_tables
+from ui.risk_tables import _render_attention_list, _render_risk_summary, _render_teacher_breakdown
+
+
+@timed
+def render_risk_page():
+    """
+    Render the Needs Attention page: every student scored at once by the
+    risk engine (logic/risk.py), instead of clicking through them one by one.
+    """
+
+    # Inject global CSS
+    inject_css()
+
+    st.title("🚨 Needs Attention")
+    st.markdown("---")
+
+    with span("logic.load_risk_tables"):
+        risk, by_teacher = load_risk_tables()
+
+    if risk.empty:
+        st.info("No students found in the system.")
+        return
+
+    # --- SUMMARY METRICS ---
+    _render_risk_summary(risk)
+
+    st.markdown("---")
+
+    # --- STUDENTS TO FOLLOW UP ---
+    st.markdown("### 📋 Students to Follow Up")
+    _render_attention_section(risk)
+
+    # --- PER-TEACHER BREAKDOWN ---
+    st.markdown("---")
+    st.markdown("### 👨‍🏫 By Teacher")
+    _render_teacher_breakdown(by_teacher)
+
+
+# Changing a filter reruns only the list, not the whole page
+@st.fragment
+@timed
+def _render_attention_section(risk):
+    _render_attention_list(risk)
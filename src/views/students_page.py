@@ -1,6 +1,8 @@
 import streamlit as st
-from logic.metrics import calculate_student_metrics
+from data.mongo import load_student
+from logic.metrics import get_student_metrics, load_student_metrics, loaded_student_metrics
 from ui.css import inject_css
+from telemetry.spans import span, timed
 from ui.layout import (
     render_student_top_metrics,
     render_student_profile,
@@ -8,31 +10,32 @@ from ui.layout import (
     render_all_students_overview
 )
 
-def render_students_dashboard(df, selected_name, total_lessons):
+@timed
+def render_students_dashboard(roster, selected_id, total_lessons):
     """
-    Renders the student dashboard page.
+    Renders the student dashboard page. Only the selected student's full
+    document is fetched; everything else comes from the lightweight roster.
     Must contain ONLY UI inside this function.
     """
 
     # Safety check — avoids crashes if no student selected
-    if not selected_name:
+    if not selected_id:
         st.info("Please select a student from the sidebar.")
         return
 
     # Inject global CSS
     inject_css()
 
-    # Pull student record
-    student_row = df[df["name"] == selected_name]
+    # Pull the selected student's full record (cached per student)
+    with span("data.load_student"):
+        student = load_student(selected_id)
 
-    if student_row.empty:
+    if student is None:
         st.error("Student not found in DB.")
         return
 
-    student = student_row.iloc[0]
-
-    # Compute metrics once
-    metrics = calculate_student_metrics(student)
+    # Read from the cohort table when it is loaded, otherwise compute for this student only
+    metrics = get_student_metrics(student, loaded_student_metrics())
 
     # ----------------------------------------------------
     # PAGE CONTENT
@@ -47,8 +50,21 @@ def render_students_dashboard(df, selected_name, total_lessons):
     render_student_profile(student)
 
     # --- ANALYSIS SECTION ---
-    render_practice_analysis(student, metrics)
+    _render_analysis_section(student, metrics)
 
     # --- CHARTS / ALL STUDENTS OVERVIEW ---
     st.markdown("### 📊 Overall Student Analytics")
-    render_all_students_overview(df)
+    _render_overview_section(roster)
+
+
+# Fragments: widgets inside these sections rerun only their own section
+@st.fragment
+@timed
+def _render_analysis_section(student, metrics):
+    render_practice_analysis(student, metrics)
+
+
+@st.fragment
+@timed
+def _render_overview_section(roster):
+    render_all_students_overview(roster, load_metrics=load_student_metrics)
@@ -1,14 +1,18 @@
 import streamlit as st
 
 from ui.teachers_css import inject_css
-from logic.teachers_metric import categorize_students_by_teacher, _render_summary_metrics
-from ui.teachers_leadboards import _render_leaderboard
+from telemetry.spans import timed
+from logic.teachers_metric import _render_summary_metrics
+from ui.teachers_leadboards import _render_bulk_export, _render_leaderboard
+from logic.exports import EXPORT_FORMATS, get_bulk_exporter
 from logic.teachers_tables import _render_teacher_details, _render_teacher_selector
 
 
-def render_teachers_page(df):
+@timed
+def render_teachers_page(teacher_data):
     """
-    Render the full Teachers Overview dashboard.
+    Render the full Teachers Overview dashboard from the
+    teacher summary returned by load_teacher_data.
     Should only run UI logic when this function is called,
     not on module import.
     """
@@ -19,14 +23,6 @@ def render_teachers_page(df):
     st.title("👨‍🏫 Teachers Overview")
     st.markdown("---")
 
-    # Guard: no data available
-    if df.empty:
-        st.warning("No student data available.")
-        return
-
-    # Organize students by teacher
-    teacher_data = categorize_students_by_teacher(df)
-
     # Guard: maybe no teachers field
     if not teacher_data:
         st.info("No teachers found in the system.")
@@ -37,16 +33,48 @@ def render_teachers_page(df):
 
     st.markdown("---")
 
-    # --- TEACHER SELECTOR ---
+    # --- TEACHER SELECTOR + DETAILS ---
+    _render_teacher_panel(teacher_data)
+
+    # --- LEADERBOARD ---
+    st.markdown("### 🏆 Teacher Leaderboard")
+    _render_leaderboard(teacher_data)
+
+    # --- FULL EXPORT ---
+    st.markdown("---")
+    _render_export_panel(teacher_data)
+
+
+@st.fragment
+@timed
+def _render_teacher_panel(teacher_data):
+    """
+    Teacher selector and details as a fragment: changing the selection
+    reruns only this section, not the summary metrics or the leaderboard.
+    """
     selected_teacher = _render_teacher_selector(teacher_data)
 
     st.markdown("---")
 
-    # --- TEACHER DETAILS ---
     if selected_teacher:
         _render_teacher_details(selected_teacher, teacher_data)
 
-    # --- LEADERBOARD ---
-    st.markdown("### 🏆 Teacher Leaderboard")
-    _render_leaderboard(teacher_data)
 
+
+def _render_export_panel(teacher_data):
+    """
+    Bulk export controls as a fragment that polls once a second, only while
+    this dataset's zip is being built.
+    """
+    fmt = st.session_state.get("bulk_export_format", EXPORT_FORMATS[0])
+    job = get_bulk_exporter().job(teacher_data.version, fmt)
+    running = job is not None and job["status"] == "running"
+
+    st.fragment(_export_fragment, run_every=1 if running else None)(teacher_data, running)
+
+
+def _export_fragment(teacher_data, polling):
+    running = _render_bulk_export(teacher_data)
+    if running != polling:
+        # Build started or finished: rerun the app to switch polling on or off
+        st.rerun()
@@ -0,0 +1,160 @@
+"""
+Process warm-up and readiness.
+
+run_warmup() fills the process-wide caches the first visitor would otherwise
+pay for: the roster, the student and search indexes, the teacher summary, the
+cohort metrics, the risk tables and the charts of the most recently active students.
+The readiness server reports 200 on /ready only once the warm-up is done, so a
+load balancer can keep traffic away from cold replicas.
+"""
+import json
+import logging
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from telemetry.spans import span
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupState:
+    """Progress of the warm-up stages, shared with the readiness server."""
+
+    def __init__(self):
+        self.ready = False
+        self.started_at = time.time()
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, status, seconds=None, error=None):
+        with self._lock:
+            self.stages[stage] = {"status": status, "seconds": seconds, "error": error}
+
+    def mark_ready(self):
+        with self._lock:
+            self.ready = True
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "stages": dict(self.stages),
+            }
+
+
+STATE = WarmupState()
+
+
+def _run_stage(name, fn, required=False, retry_seconds=5):
+    """
+    Run one warm-up stage. Required stages (the dataset itself) are retried
+    until they succeed; optional ones are logged and skipped on failure.
+    """
+    while True:
+        STATE.record(name, "running")
+        start = time.perf_counter()
+        try:
+            with span(f"warmup.{name}"):
+                result = fn()
+        except Exception as e:
+            logger.exception("Warm-up stage %s failed", name)
+            STATE.record(name, "failed", error=str(e))
+            if not required:
+                return None
+            time.sleep(retry_seconds)
+            continue
+
+        STATE.record(name, "done", seconds=round(time.perf_counter() - start, 3))
+        return result
+
+
+def _wait_for_runtime(timeout=60):
+    """Per-session caches (st.cache_data) only work once the Streamlit runtime exists."""
+    from streamlit.runtime import Runtime
+
+    deadline = time.monotonic() + timeout
+    while not Runtime.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+
+def recent_student_ids(roster, limit):
+    """Ids of the students who practiced most recently."""
+    if roster.empty or limit <= 0:
+        return []
+    if "last_practice_at" in roster.columns:
+        roster = roster.sort_values("last_practice_at", ascending=False, na_position="last")
+    return roster["student_id"].head(limit).tolist()
+
+
+def run_warmup(students=20):
+    """Prefetch data, build derived tables and pre-render charts for `students` recent students."""
+    _wait_for_runtime()
+
+    from data.mongo import load_roster, load_student
+    from logic.metrics import load_student_metrics
+    from logic.risk import load_risk_tables
+    from logic.search_index import get_search_index
+    from logic.student_index import get_student_index
+    from logic.teachers_metric import load_teacher_data
+    from ui.layout import prerender_student_charts
+
+    roster = _run_stage("roster", load_roster, required=True)
+    _run_stage("student_index", lambda: get_student_index(roster))
+    _run_stage("search_index", lambda: get_search_index(roster))
+    _run_stage("teacher_summary", load_teacher_data)
+    _run_stage("cohort_metrics", load_student_metrics)
+    _run_stage("risk", load_risk_tables)
+
+    def render_recent():
+        for student_id in recent_student_ids(roster, students):
+            try:
+                student = load_student(student_id)
+                if student is not None:
+                    prerender_student_charts(student)
+            except Exception:
+                # One malformed record should not leave the other students cold
+                logger.warning("Warm-up: could not pre-render charts of %s", student_id, exc_info=True)
+
+    _run_stage("charts", render_recent)
+
+    STATE.mark_ready()
+    logger.info("Warm-up finished: %s", STATE.snapshot()["stages"])
+
+
+def start_warmup(students=20):
+    thread = threading.Thread(target=run_warmup, args=(students,), name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# --- Readiness endpoint ---
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/ready"):
+            body = STATE.snapshot()
+            status = 200 if body["ready"] else 503
+        elif self.path.startswith("/live"):
+            body, status = {"alive": True}, 200
+        else:
+            body, status = {"error": "not found"}, 404
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Probes hit this every few seconds; keep them out of the app log
+        pass
+
+
+def start_readiness_server(port, host="0.0.0.0"):
+    """Serve /ready (200 once warmed, else 503) and /live on a side port."""
+    server = ThreadingHTTPServer((host, port), _ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name="readiness", daemon=True).start()
+    return server
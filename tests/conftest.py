@@ -0,0 +1,46 @@
+import os
+import sys
+
+# Settings are read at import time; tests never need a real MongoDB unless they say so
+os.environ.setdefault("TOTAL_LESSONS", "18")
+os.environ.setdefault("MONGO_HOST", "localhost")
+os.environ.setdefault("MONGO_PORT", "27017")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: needs a live MongoDB (MONGO_TEST_URI); skipped when none is reachable")
+
+
+# --- Shared test data helpers (import with `from conftest import ...`) ---
+def lesson(number, teacher="Dana", practice_count=1, first_practice="Sun, 01.02.2024"):
+    return {"lesson": number, "teacher": teacher, "practice_count": practice_count, "first_practice": first_practice}
+
+
+def student_doc(name, lessons=(), **fields):
+    """A student_stats document; `fields` override the defaults."""
+    return {
+        "name": name,
+        "phone_number": "050-0000000",
+        "current_lesson": 1,
+        "total_messages": 3,
+        "last_message_timedate": "Mon, 02.03.2024",
+        "last_practice_timedate": "Mon, 02.03.2024",
+        "lessons": list(lessons),
+        **fields,
+    }
+
+
+def normalize_summary(summary):
+    """Plain, comparable teacher summary: the implementations return different scalar types."""
+    return {
+        teacher: {
+            "total_practices": int(data["total_practices"]),
+            "current": [{k: str(v) for k, v in s.items()} for s in data["current"]],
+            "past": [{k: str(v) for k, v in s.items()} for s in data["past"]],
+        }
+        for teacher, data in summary.items()
+    }
@@ -0,0 +1,88 @@
+"""
+Parity of the teacher summary paths with categorize_students_by_teacher.
+
+- Python path (TEACHER_STATS_MODE=python): documents read from a mongomock
+  collection through MongoSource, categorized over the columnar tables.
+- Server path (TEACHER_STATS_MODE=server): the aggregation pipeline. mongomock
+  has no $convert, so this needs a real mongod (MONGO_TEST_URI, default
+  mongodb://localhost:27017) and is marked `integration`; it is skipped when
+  none is reachable.
+"""
+import os
+import uuid
+
+import mongomock
+import pytest
+
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from benchmarks.synthetic import generate_students
+from conftest import lesson, normalize_summary, student_doc
+from data.aggregations import aggregate_teacher_summary
+from data.tables import build_students_frame
+from logic.teachers_metric import categorize_students_by_teacher, categorize_students_by_teacher_columnar
+
+MONGO_TEST_URI = os.getenv("MONGO_TEST_URI", "mongodb://localhost:27017")
+
+
+@pytest.fixture
+def collection():
+    client = MongoClient(MONGO_TEST_URI, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip(f"no mongod reachable at {MONGO_TEST_URI}")
+
+    db = client[f"dashboard_test_{uuid.uuid4().hex[:8]}"]
+    yield db["student_stats"]
+    client.drop_database(db.name)
+    client.close()
+
+
+def _edge_cases():
+    fields = {"current_lesson": 3, "last_practice_timedate": "Mon, 02.03.2024"}
+    return [
+        # Malformed practice counts count as 0
+        student_doc("Malformed", [lesson(1, "Dana", "x"), lesson(2, "Dana", None), lesson(3, "Dana", "4")], **fields),
+        # Missing and empty teachers are not teachers
+        student_doc("No Teacher", [lesson(1, None), lesson(2, "")], **fields),
+        student_doc("Last Lesson Untaught", [lesson(1, "Ron", 2), lesson(2, "")], **fields),
+        # Tied lesson numbers: the first one wins the active teacher
+        student_doc("Tied", [lesson(2, "Ron"), lesson(2, "Dana"), lesson(1, "Maya")], **fields),
+        student_doc("No Lessons", [], **fields),
+    ]
+
+
+def _docs():
+    docs = generate_students(500, malformed_rate=0.1, seed=11) + _edge_cases()
+    for doc in docs:
+        doc.setdefault("_id", ObjectId())
+    return docs
+
+
+def test_python_path_matches_row_wise(monkeypatch):
+    import data.sources
+
+    docs = _docs()
+    mock = mongomock.MongoClient().db.student_stats
+    mock.insert_many(docs)
+    monkeypatch.setattr(data.sources, "get_collection", lambda: mock)
+
+    students, lessons = data.sources.MongoSource().student_tables()
+    expected = categorize_students_by_teacher(build_students_frame(docs))
+
+    assert normalize_summary(categorize_students_by_teacher_columnar(students, lessons)) == normalize_summary(expected)
+
+
+@pytest.mark.integration
+def test_teacher_summary_matches_python(collection):
+    docs = _docs()
+    collection.insert_many(docs)
+
+    # The pipeline orders each student list by _id; the Python version follows the roster
+    docs = sorted(docs, key=lambda doc: doc["_id"])
+    expected = categorize_students_by_teacher(build_students_frame(docs))
+
+    assert normalize_summary(aggregate_teacher_summary(collection)) == normalize_summary(expected)
@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from data.cache import StaleWhileRevalidate
+
+
+class _Loader:
+    """Counts calls; each call blocks until released, then returns its call number."""
+
+    __name__ = "loader"
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        assert self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("mongo down")
+        return self.calls
+
+
+def _wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_concurrent_cold_gets_share_one_load():
+    loader = _Loader()
+    loader.release.clear()
+    cache = StaleWhileRevalidate(loader, ttl=60)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    _wait_until(lambda: loader.calls == 1)
+    time.sleep(0.05)  # give the other threads time to pile up behind the load
+    loader.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert loader.calls == 1
+    assert results == [1] * 8
+
+
+def test_stale_get_returns_immediately_and_refreshes_once():
+    loader = _Loader()
+    cache = StaleWhileRevalidate(loader, ttl=0)
+    assert cache.get() == 1
+
+    loader.release.clear()
+    start = time.monotonic()
+    assert [cache.get() for _ in range(5)] == [1] * 5
+    assert time.monotonic() - start < 1
+
+    _wait_until(lambda: loader.calls == 2)
+    loader.release.set()
+    cache.wait()
+
+    assert loader.calls == 2
+    assert cache.get() == 2
+
+
+def test_failed_refresh_keeps_last_good_value():
+    loader = _Loader()
+    cache = StaleWhileRevalidate(loader, ttl=60)
+    assert cache.get() == 1
+
+    loader.fail = True
+    cache.refresh()
+
+    assert cache.get() == 1
+    assert isinstance(cache.error, RuntimeError)
+
+    loader.fail = False
+    cache.refresh()
+
+    assert cache.get() == 3
+    assert cache.error is None
+
+
+def test_failed_first_load_raises_and_retries():
+    loader = _Loader()
+    loader.fail = True
+    cache = StaleWhileRevalidate(loader, ttl=60)
+
+    with pytest.raises(RuntimeError, match="mongo down"):
+        cache.get()
+    assert cache.age() is None
+
+    loader.fail = False
+    assert cache.get() == 2
+
+
+def test_overlapping_refreshes_share_one_load():
+    loader = _Loader()
+    cache = StaleWhileRevalidate(loader, ttl=60)
+    cache.get()
+
+    loader.release.clear()
+    cache.refresh(wait=False)
+    cache.refresh(wait=False)
+    _wait_until(lambda: loader.calls == 2)
+    cache.refresh(wait=False)
+    loader.release.set()
+    cache.wait()
+
+    assert loader.calls == 2
+    assert cache.get() == 2
@@ -0,0 +1,29 @@
+from streamlit.testing.v1 import AppTest
+
+
+def _student_page():
+    # AppTest runs this function's source as a script: imports go inside
+    from conftest import lesson, student_doc
+    from data.tables import build_students_frame
+    from logic.metrics import calculate_student_metrics
+    from ui.layout import render_practice_analysis, render_student_profile, render_student_top_metrics
+
+    counts = ["x", None, "3.5", "2"]
+    lessons = [lesson(i + 1, practice_count=count) for i, count in enumerate(counts)] + [{"lesson": 5, "teacher": "Dana"}]
+    doc = student_doc("Malformed Counts", lessons, current_lesson=5)
+    student = build_students_frame([doc]).iloc[0].to_dict()
+    metrics = calculate_student_metrics(student)
+
+    render_student_top_metrics(student, metrics)
+    render_student_profile(student)
+    render_practice_analysis(student, metrics)
+
+
+def test_student_page_survives_malformed_practice_counts():
+    at = AppTest.from_function(_student_page, default_timeout=60).run()
+    assert not at.exception
+
+    views = at.radio(key="practice_view")
+    for view in views.options:
+        views.set_value(view).run()
+        assert not at.exception, view
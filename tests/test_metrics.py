@@ -0,0 +1,24 @@
+import pytest
+
+from benchmarks.synthetic import generate_students
+from data.tables import build_student_tables, build_students_frame
+from logic.metrics import calculate_cohort_metrics, calculate_student_metrics, get_student_metrics
+
+
+@pytest.fixture(scope="module")
+def docs():
+    return generate_students(300, lessons_per_student=(0, 18), malformed_rate=0.1, seed=5)
+
+
+def test_cohort_row_matches_per_student_metrics(docs):
+    table = calculate_cohort_metrics(*build_student_tables(docs))
+
+    for _, student in build_students_frame(docs).iterrows():
+        assert get_student_metrics(student, table) == pytest.approx(calculate_student_metrics(student))
+
+
+def test_falls_back_without_cohort_row(docs):
+    student = build_students_frame(docs[:1]).iloc[0]
+
+    assert get_student_metrics(student) == calculate_student_metrics(student)
+    assert get_student_metrics(student, calculate_cohort_metrics(*build_student_tables(docs[1:2]))) == calculate_student_metrics(student)
@@ -0,0 +1,117 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from bson import ObjectId
+from data.tables import build_student_tables
+from logic.risk import RISK_REASONS, calculate_risk, risk_by_teacher, _practice_trend
+
+TODAY = date(2024, 6, 30)
+
+
+def _day(days_ago):
+    return (TODAY - timedelta(days=days_ago)).strftime("%a, %d.%m.%Y")
+
+
+def _student(name, counts, last_practice_days_ago, latest_started_days_ago, teacher="Dana", current_lesson=None):
+    """Lessons 1..n with the given practice counts; the latest one started `latest_started_days_ago`."""
+    lessons = [
+        {"lesson": i + 1, "teacher": teacher, "practice_count": count, "first_practice": _day(latest_started_days_ago + 7 * (len(counts) - 1 - i))}
+        for i, count in enumerate(counts)
+    ]
+    return {
+        "_id": ObjectId(),
+        "name": name,
+        "phone_number": "050-0000000",
+        "current_lesson": current_lesson or len(counts),
+        "last_practice_timedate": _day(last_practice_days_ago),
+        "lessons": lessons,
+    }
+
+
+@pytest.fixture(scope="module")
+def risk():
+    docs = [
+        _student("Active", [3, 3, 3, 3], 1, 2),
+        # Stopped practicing a week into its latest lesson: inactive, and stuck on that lesson
+        _student("Inactive", [3, 3, 3], 30, 37),
+        _student("Declining", [8, 6, 4, 2], 1, 2, teacher="Ron"),
+        _student("Stalled", [3, 3], 1, 30, teacher="Ron"),
+        _student("Inconsistent", [1, 10, 1, 10], 1, 2),
+        _student("Completed", [3] * 18, 60, 100, current_lesson=18),
+        {"_id": ObjectId(), "name": "No Lessons", "phone_number": "050-1111111", "current_lesson": 0, "lessons": []},
+    ]
+    risk = calculate_risk(*build_student_tables(docs), TODAY)
+    return risk.set_index("name")
+
+
+@pytest.mark.parametrize("name, flags", [
+    ("Active", set()),
+    ("Inactive", {"inactive", "stalled"}),
+    ("Declining", {"declining"}),
+    ("Stalled", {"stalled"}),
+    ("Inconsistent", {"inconsistent"}),
+    ("Completed", set()),
+    ("No Lessons", set()),
+])
+def test_flags(risk, name, flags):
+    row = risk.loc[name]
+    assert {flag for flag in RISK_REASONS if row[flag]} == flags
+    assert row["needs_attention"] == bool(flags)
+    assert row["reasons"] == " · ".join(RISK_REASONS[flag] for flag in RISK_REASONS if flag in flags)
+
+
+def test_scores(risk):
+    # Signals below their thresholds still add a little
+    assert 0 < risk.loc["Active", "risk_score"] < 5
+    assert risk.loc["Completed", "risk_score"] == 0
+    assert risk.loc["No Lessons", "risk_score"] == 0
+
+    # Inactive (30 days, full strength) outweighs the other single signals
+    assert risk.loc["Inactive", "risk_score"] > risk.loc["Declining", "risk_score"]
+    assert risk.loc["Declining", "risk_score"] > risk.loc["Stalled", "risk_score"]
+    assert risk.loc["Stalled", "risk_score"] > risk.loc["Inconsistent", "risk_score"] > 0
+
+    # Highest risk first
+    assert risk.index[0] == "Inactive"
+    assert list(risk["risk_score"]) == sorted(risk["risk_score"], reverse=True)
+
+
+def test_days(risk):
+    assert risk.loc["Inactive", "days_inactive"] == 30
+    assert risk.loc["Stalled", "days_on_lesson"] == 30
+    assert pd.isna(risk.loc["No Lessons", "days_on_lesson"])
+
+
+def test_practice_trend_matches_least_squares():
+    docs = [_student("A", [1, 9, 8, 6, 4, 2], 1, 2), _student("B", [2, 2], 1, 2), _student("C", [0, 0, 0], 1, 2)]
+    _, lessons = build_student_tables(docs)
+    trend = _practice_trend(lessons.assign(practice_count=lessons["practice_count"].astype("float64")))
+
+    # Last 4 lessons only: 8, 6, 4, 2 -> slope -2 over a mean of 5
+    assert trend.iloc[0] == pytest.approx(-0.4)
+    # Fewer than 3 lessons, or nothing practiced: no trend
+    assert trend.iloc[1:].isna().all()
+
+
+def test_empty_lessons():
+    docs = [{"_id": ObjectId(), "name": name, "phone_number": "", "current_lesson": 0, "lessons": []} for name in ("A", "B")]
+    risk = calculate_risk(*build_student_tables(docs), TODAY)
+
+    assert len(risk) == 2
+    assert not risk["needs_attention"].any()
+    assert (risk["risk_score"] == 0).all()
+
+
+def test_risk_by_teacher(risk):
+    table = risk_by_teacher(risk.reset_index())
+
+    assert table.loc["Dana", "students"] == 4
+    assert table.loc["Dana", "needs_attention"] == 2
+    assert table.loc["Ron", "students"] == 2
+    assert table.loc["Ron", "declining"] == 1 and table.loc["Ron", "stalled"] == 1
+    assert table.loc["Ron", "attention_rate"] == 100
+    assert table.loc["Unassigned", "students"] == 1
+    # Most students needing attention first
+    assert list(table["needs_attention"]) == sorted(table["needs_attention"], reverse=True)
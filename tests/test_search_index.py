@@ -0,0 +1,80 @@
+import pytest
+
+from logic.search_index import StudentSearchIndex, normalize
+
+
+@pytest.fixture
+def index():
+    return StudentSearchIndex(
+        ["dana", "noa", "ron", "maya", "dan"],
+        ["Dana Levi", "נועה כהן", "Ron Cohen", "Maya Levin", "Dan"],
+        ["050-1234567", "052-7654321", None, "054-1112223", "050-9999999"],
+    )
+
+
+def test_normalize_folds_case_accents_and_hebrew_finals():
+    assert normalize("  José  ÁLVAREZ ") == "jose alvarez"
+    assert normalize("כֹּהֵן") == "כהנ"
+
+
+def test_empty_query_returns_everyone(index):
+    assert index.search("  ") == ["dana", "noa", "ron", "maya", "dan"]
+
+
+def test_prefix(index):
+    assert index.search("maya") == ["maya"]
+    assert index.search("Ron C") == ["ron"]
+
+
+def test_word_prefix(index):
+    assert sorted(index.search("lev")) == ["dana", "maya"]
+    assert index.search("coh") == ["ron"]
+
+
+def test_substring(index):
+    assert index.search("ohe") == ["ron"]
+    assert index.search("ana l") == ["dana"]
+
+
+def test_hebrew_final_letters(index):
+    # A partial word ends in a regular letter where the full name has a final one
+    assert index.search("כה") == ["noa"]
+    assert index.search("כהנ") == ["noa"]
+    assert index.search("כהן") == ["noa"]
+
+
+def test_phone_digits(index):
+    assert index.search("123 45") == ["dana"]
+    assert index.search("0527") == ["noa"]
+    assert index.search("999", match_phone=False) == []
+
+
+def test_ranking_exact_then_prefix_then_word_prefix(index):
+    # "dan": exact name, then name prefix ("Dana Levi")
+    assert index.search("dan") == ["dan", "dana"]
+    # "levi": word prefix of both, ties broken by name
+    assert index.search("levi") == ["dana", "maya"]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("levy", "dana"),
+    ("dana levy", "dana"),
+    ("cohn", "ron"),
+    ("נעוה", "noa"),
+])
+def test_typo_in_one_word(index, query, expected):
+    assert index.search(query)[0] == expected
+    assert index.search(query, fuzzy=False) == []
+
+
+def test_fuzzy_ranked_after_direct_matches(index):
+    # "levin" matches Maya directly and Dana only through the typo path
+    assert index.search("levin") == ["maya", "dana"]
+
+
+def test_unrelated_query_matches_nothing(index):
+    assert index.search("xyz") == []
+
+
+def test_limit(index):
+    assert index.search("levi", limit=1) == ["dana"]
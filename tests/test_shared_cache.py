@@ -0,0 +1,53 @@
+import os
+import stat
+
+import pytest
+
+from data.shared_cache import DiskCache, SharedCacheError
+
+
+def test_roundtrip_and_missing_key(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), 1_000_000)
+    cache.put("a", b"data")
+
+    assert cache.get("a") == b"data"
+    assert cache.get("b") is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), 10_000)
+    for i in range(5):
+        cache.put(f"k{i}", b"x" * 3000)
+        os.utime(cache._file(f"k{i}"), (i, i))  # deterministic ages
+
+    cache.evict()
+
+    assert cache.stats()["bytes"] <= 10_000 * DiskCache.low_water
+    assert cache.get("k0") is None
+    assert cache.get("k4") is not None
+
+
+def test_directory_is_created_private(tmp_path):
+    path = tmp_path / "cache"
+    DiskCache(str(path), 1000)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o700
+
+
+def test_refuses_directory_writable_by_others(tmp_path):
+    path = tmp_path / "cache"
+    path.mkdir()
+    path.chmod(0o777)
+
+    with pytest.raises(SharedCacheError):
+        DiskCache(str(path), 1000)
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root to chown")
+def test_refuses_directory_owned_by_another_user(tmp_path):
+    path = tmp_path / "cache"
+    path.mkdir(mode=0o700)
+    os.chown(path, 12345, 12345)
+
+    with pytest.raises(SharedCacheError):
+        DiskCache(str(path), 1000)
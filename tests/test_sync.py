@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta
+
+import mongomock
+import pytest
+
+from pymongo.errors import OperationFailure
+
+from conftest import lesson as _lesson, student_doc
+from data.sync import StudentSync
+
+START = datetime(2024, 1, 1)
+
+
+def _doc(name, minutes=0, lesson=1):
+    return student_doc(name, [_lesson(lesson)], current_lesson=lesson, updated_at=START + timedelta(minutes=minutes))
+
+
+@pytest.fixture
+def collection():
+    collection = mongomock.MongoClient().db.student_stats
+    collection.insert_many([_doc("A"), _doc("B", 1), _doc("C", 2)])
+    return collection
+
+
+def _names(sync):
+    return sorted(sync.frame()["name"])
+
+
+def test_first_sync_is_a_full_load(collection):
+    sync = StudentSync(collection, interval=0)
+
+    assert _names(sync) == ["A", "B", "C"]
+    assert sync.version == 1
+
+
+def test_update_past_watermark(collection):
+    sync = StudentSync(collection, interval=0)
+    sync.frame()
+
+    collection.update_one({"name": "B"}, {"$set": {"current_lesson": 5, "updated_at": START + timedelta(minutes=10)}})
+
+    assert sync.sync() is True
+    frame = sync.frame()
+    assert frame.loc[frame["name"] == "B", "current_lesson"].item() == 5
+
+
+def test_unchanged_collection_is_not_a_change(collection):
+    sync = StudentSync(collection, interval=0)
+    sync.frame()
+    version = sync.version
+
+    assert sync.sync() is False
+    assert sync.version == version
+
+
+def test_insert(collection):
+    sync = StudentSync(collection, interval=0)
+    sync.frame()
+
+    collection.insert_one(_doc("D", 10))
+
+    assert _names(sync) == ["A", "B", "C", "D"]
+
+
+def test_insert_without_watermark(collection):
+    sync = StudentSync(collection, interval=0)
+    sync.frame()
+
+    doc = _doc("E")
+    del doc["updated_at"]
+    collection.insert_one(doc)
+
+    assert _names(sync) == ["A", "B", "C", "E"]
+
+
+def test_delete_found_by_id_diff(collection):
+    sync = StudentSync(collection, interval=0)
+    sync.frame()
+
+    collection.delete_one({"name": "A"})
+
+    assert _names(sync) == ["B", "C"]
+
+
+def test_force_sync_ignores_interval(collection):
+    sync = StudentSync(collection, interval=3600)
+    sync.frame()
+    collection.insert_one(_doc("D", 10))
+
+    assert sync.sync() is False  # not due yet
+    assert _names(sync) == ["A", "B", "C"]
+
+    assert sync.sync(force=True) is True
+    assert _names(sync) == ["A", "B", "C", "D"]
+
+
+def test_tables_follow_the_sync(collection):
+    sync = StudentSync(collection, interval=0)
+    students, lessons = sync.tables()
+    assert len(students) == 3 and len(lessons) == 3
+
+    collection.delete_one({"name": "C"})
+
+    students, lessons = sync.tables()
+    assert sorted(students["name"]) == ["A", "B"]
+    assert len(lessons) == 2
+
+
+class _NoChangeStreams:
+    """Collection whose server rejects change streams (standalone mongod)."""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def watch(self, *args, **kwargs):
+        raise OperationFailure("The $changeStream stage is only supported on replica sets")
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+@pytest.mark.parametrize("wrap", [lambda c: c, _NoChangeStreams], ids=["mongomock", "standalone"])
+def test_falls_back_to_watermark_without_change_streams(collection, wrap):
+    sync = StudentSync(wrap(collection), interval=0)
+    sync.frame()
+    assert sync._stream is None
+
+    collection.update_one({"name": "A"}, {"$set": {"name": "A2", "updated_at": START + timedelta(minutes=10)}})
+    collection.delete_one({"name": "C"})
+
+    assert _names(sync) == ["A2", "B"]
+
+
+def test_force_sync_picks_up_update_without_watermark_change(collection):
+    sync = StudentSync(collection, interval=0)
+    sync.frame()
+
+    # Writer that does not touch updated_at: invisible to the delta query
+    collection.update_one({"name": "B"}, {"$set": {"current_lesson": 7}})
+    assert sync.sync() is False
+
+    assert sync.sync(force=True) is True
+    frame = sync.frame()
+    assert frame.loc[frame["name"] == "B", "current_lesson"].item() == 7
+
+
+def test_without_watermark_falls_back_to_slow_full_reloads(caplog):
+    collection = mongomock.MongoClient().db.student_stats
+    docs = [_doc("A"), _doc("B")]
+    for doc in docs:
+        del doc["updated_at"]
+    collection.insert_many(docs)
+
+    with caplog.at_level("WARNING", logger="data.sync"):
+        sync = StudentSync(collection, interval=0, full_interval=3600)
+        assert _names(sync) == ["A", "B"]
+    assert "Incremental sync unavailable" in caplog.text
+
+    # Full reloads run every full_interval, not every interval
+    doc = _doc("C")
+    del doc["updated_at"]
+    collection.insert_one(doc)
+    assert sync.sync() is False
+    assert _names(sync) == ["A", "B"]
+
+    assert sync.sync(force=True) is True
+    assert _names(sync) == ["A", "B", "C"]
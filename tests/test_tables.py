@@ -0,0 +1,80 @@
+import pandas as pd
+import pytest
+
+from conftest import lesson, student_doc as _doc
+from data.tables import build_students_frame
+
+
+def test_students_frame_student_without_lessons():
+    # load_student builds a one-document frame for the selected student
+    frame = build_students_frame([_doc("No Lessons", [])])
+
+    assert frame.iloc[0]["lessons"] == []
+    assert pd.isna(frame.iloc[0]["first_practice_at"])
+
+
+def test_students_frame_mixed_lessons():
+    frame = build_students_frame([_doc("A", [lesson(1, practice_count=2)]), _doc("B", [])])
+
+    assert frame["first_practice_at"].iloc[0] == pd.Timestamp("2024-02-01")
+    assert pd.isna(frame["first_practice_at"].iloc[1])
+
+
+def test_frame_from_tables_matches_documents():
+    from benchmarks.synthetic import generate_students
+    from data.tables import build_student_tables, students_frame_from_tables
+
+    docs = generate_students(200, seed=7) + [_doc("No Lessons", [])]
+    students, lessons = build_student_tables(docs)
+    frame = students_frame_from_tables(students, lessons, "v")
+
+    expected = build_students_frame(docs)
+    pd.testing.assert_series_equal(
+        frame["first_practice_at"], expected["first_practice_at"], check_names=False, check_index=False
+    )
+    assert frame.iloc[-1]["lessons"] == []
+
+
+def test_frame_from_tables_without_any_lessons():
+    from data.tables import build_student_tables, students_frame_from_tables
+
+    students, lessons = build_student_tables([_doc("A", []), _doc("B", [])])
+    frame = students_frame_from_tables(students, lessons, "v")
+
+    assert frame["first_practice_at"].isna().all()
+    assert frame["first_practice_at"].dtype == "datetime64[ns]"
+
+
+def test_snapshot_student_without_lessons(tmp_path):
+    from data.snapshot import SnapshotSource, write_snapshot
+
+    write_snapshot([_doc("A", []), _doc("B", [])], tmp_path)
+    source = SnapshotSource(tmp_path)
+    student_id = source.roster()["student_id"].iloc[0]
+
+    assert source.student(student_id)["lessons"] == []
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+def test_streamed_tables_match_built_tables(batch_size):
+    from benchmarks.synthetic import generate_students
+    from data.streaming import stream_student_tables
+    from data.tables import build_student_tables
+
+    docs = generate_students(150, lessons_per_student=(0, 18), malformed_rate=0.1, seed=3) + [_doc("No Lessons", [])]
+    docs[0]["last_practice_timedate"] = "not a date"
+
+    _assert_same_tables(stream_student_tables(iter(docs), batch_size=batch_size), build_student_tables(docs))
+
+
+def test_streamed_tables_empty_input():
+    from data.streaming import stream_student_tables
+    from data.tables import build_student_tables
+
+    _assert_same_tables(stream_student_tables(iter([]), batch_size=7), build_student_tables([]))
+
+
+def _assert_same_tables(streamed, built):
+    for got, expected in zip(streamed, built):
+        pd.testing.assert_frame_equal(got, expected)
+        assert got.attrs == expected.attrs
@@ -0,0 +1,55 @@
+import random
+
+import mongomock
+import pytest
+
+from bson import ObjectId
+
+from benchmarks.synthetic import generate_students
+from conftest import normalize_summary
+from data.sync import StudentSync
+from data.tables import build_student_tables, build_students_frame
+from logic.teachers_metric import categorize_students_by_teacher, categorize_students_by_teacher_columnar
+
+
+def _randomized_roster(seed):
+    docs = generate_students(300, lessons_per_student=(0, 18), malformed_rate=0.1, seed=seed)
+    rng = random.Random(seed)
+    for doc in rng.sample(docs, 30):
+        lesson = rng.choice(doc["lessons"] or [None])
+        if lesson is not None:
+            lesson["teacher"] = rng.choice([None, "", lesson["teacher"]])
+    for doc in rng.sample(docs, 20):
+        if len(doc["lessons"]) > 1:
+            doc["lessons"][-1]["lesson"] = doc["lessons"][-2]["lesson"]  # tied lesson numbers
+    return docs
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_columnar_matches_row_wise(seed):
+    docs = _randomized_roster(seed)
+
+    expected = categorize_students_by_teacher(build_students_frame(docs))
+    result = categorize_students_by_teacher_columnar(*build_student_tables(docs))
+
+    assert normalize_summary(result) == normalize_summary(expected)
+
+
+def test_incremental_mode_tables_follow_the_sync(monkeypatch):
+    import data.mongo
+
+    collection = mongomock.MongoClient().db.student_stats
+    collection.insert_many(generate_students(50, seed=4))
+    sync = StudentSync(collection, interval=0)
+
+    monkeypatch.setattr(data.mongo, "INCREMENTAL", True)
+    monkeypatch.setattr(data.mongo, "_student_sync", lambda: sync)
+
+    students, lessons = data.mongo.load_student_tables()
+    assert len(students) == 50
+
+    collection.delete_one({"_id": ObjectId(students["student_id"].iloc[0])})
+    students, _ = data.mongo.load_student_tables()
+    expected, _ = build_student_tables(list(collection.find({})))
+    assert len(students) == 49
+    assert students.attrs["version"] == expected.attrs["version"]